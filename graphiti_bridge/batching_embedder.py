@@ -0,0 +1,101 @@
+"""
+Request-coalescing wrapper for Graphiti embedders.
+
+Graphiti embeds entity names, edge facts and queries with one create() call per
+text, which costs one HTTP round-trip each. BatchingEmbedder collects the calls
+that arrive within a few milliseconds of each other and sends them as a single
+create_batch() request on the wrapped embedder.
+"""
+
+import asyncio
+import logging
+import typing
+
+from graphiti_core.embedder.client import EmbedderClient
+
+
+logger = logging.getLogger('graphiti_bridge.sync')
+
+
+class BatchingEmbedder(EmbedderClient):
+    """
+    Coalesces concurrent single-text create() calls into create_batch() requests.
+
+    A batch is sent once max_batch texts are waiting or max_wait_ms after the first
+    one arrived, whichever comes first. Identical texts in a batch are embedded once.
+    A single text may be passed bare or as a one-element list, which is how Graphiti
+    embeds node names and edge facts. Other inputs (several texts, token lists) and
+    explicit create_batch() calls go straight to the wrapped embedder; other
+    attributes are delegated to it as well.
+    """
+
+    def __init__(self, embedder: EmbedderClient, max_batch: int = 128, max_wait_ms: float = 5.0):
+        self.embedder = embedder
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        # text -> futures of the callers waiting on it, for the batch being collected
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._pending_count = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # In-flight batch requests, referenced so they are not garbage collected
+        self._requests: set[asyncio.Task] = set()
+
+    def __getattr__(self, name):
+        # Only reached for attributes not set on the wrapper (e.g. the embedder's config)
+        return getattr(self.__dict__['embedder'], name)
+
+    async def create(self, input_data: str | list[str] | typing.Iterable[int] | typing.Iterable[typing.Iterable[int]]) -> list[float]:
+        if isinstance(input_data, list) and len(input_data) == 1 and isinstance(input_data[0], str):
+            # Graphiti calls create(input_data=[text]) for a single text
+            input_data = input_data[0]
+        elif not isinstance(input_data, str):
+            return await self.embedder.create(input_data)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(input_data, []).append(future)
+        self._pending_count += 1
+
+        if self._pending_count >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        return await self.embedder.create_batch(input_data_list)
+
+    def _flush(self):
+        """Send the collected texts as one batch request"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending, self._pending_count = self._pending, {}, 0
+        if not pending:
+            return
+        task = asyncio.get_running_loop().create_task(self._send(pending))
+        self._requests.add(task)
+        task.add_done_callback(self._requests.discard)
+
+    async def _send(self, pending: dict[str, list[asyncio.Future]]):
+        texts = list(pending)
+        try:
+            try:
+                vectors = await self.embedder.create_batch(texts)
+            except NotImplementedError:
+                # Embedder without batch support: still overlap the single calls
+                vectors = await asyncio.gather(*(self.embedder.create(text) for text in texts))
+            if len(vectors) != len(texts):
+                raise ValueError(f"Embedder returned {len(vectors)} vectors for {len(texts)} texts")
+        except Exception as e:
+            logger.debug(f"[EMBEDDER-BATCH] Batch of {len(texts)} failed: {e}")
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for text, vector in zip(texts, vectors):
+            for future in pending[text]:
+                if not future.done():
+                    future.set_result(vector)
@@ -4,14 +4,145 @@ Configuration handling for Graphiti Bridge
 Handles configuration validation, environment variables, and provider-specific settings.
 """
 
+from __future__ import annotations
+
 import os
+import sys
 import json
+import functools
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict, field
-from pathlib import Path
+from dataclasses import dataclass, field, fields
+
+# Optional fast JSON parser; falls back to stdlib json when unavailable.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+
+# (attribute, snake_case key, camelCase key, default) for BridgeConfig.from_dict
+_CONFIG_FIELDS = (
+    # LLM Configuration
+    ('llm_provider', 'llm_provider', 'llmProvider', 'openai'),
+    ('llm_model', 'llm_model', 'llmModel', 'gpt-4o'),
+    ('llm_small_model', 'llm_small_model', 'llmSmallModel', None),
+
+    # Embedder Configuration
+    ('embedder_provider', 'embedder_provider', 'embedderProvider', 'openai'),
+    ('embedding_model', 'embedding_model', 'embeddingModel', 'text-embedding-3-small'),
+
+    # Database Configuration
+    ('database_type', 'database_type', 'databaseType', 'neo4j'),
+    ('database_name', 'database_name', 'databaseName', 'neo4j'),
+
+    # Legacy API keys (backward compatibility)
+    ('llm_api_key', 'llm_api_key', 'llmApiKey', ''),
+    ('embedder_api_key', 'embedder_api_key', 'embedderApiKey', None),
+
+    # Provider-specific settings
+    ('azure_endpoint', 'azure_endpoint', 'azureEndpoint', None),
+    ('azure_api_version', 'azure_api_version', 'azureApiVersion', None),
+    ('ollama_base_url', 'ollama_base_url', 'ollamaBaseUrl', None),
+    ('openrouter_preset_slug', 'openrouter_preset_slug', 'openrouterPresetSlug', None),
+    ('openrouter_use_preset_with_custom_model', 'openrouter_use_preset_with_custom_model',
+     'openrouterUsePresetWithCustomModel', False),
+
+    # Processing Configuration
+    ('models_path', 'models_path', 'modelsPath', None),
+    ('vault_path', 'vault_path', 'vaultPath', None),
+    ('batch_size', 'batch_size', 'batchSize', 10),
+    ('max_retries', 'max_retries', 'maxRetries', 3),
+    ('max_concurrency', 'max_concurrency', 'maxConcurrency', 1),
+    ('batch_embeddings', 'batch_embeddings', 'batchEmbeddings', False),
+    ('probe_embedder', 'probe_embedder', 'probeEmbedder', None),
+    ('debug', 'debug', 'debugMode', False),
+
+    # Episode and Ontology Configuration
+    ('use_custom_ontology', 'use_custom_ontology', 'useCustomOntology', False),
+    ('use_bulk_sync', 'use_bulk_sync', 'useBulkSync', False),
+    ('default_namespace', 'default_namespace', 'defaultNamespace', 'vault'),
+    ('enable_folder_namespacing', 'enable_folder_namespacing', 'enableFolderNamespacing', False),
+    ('enable_property_namespacing', 'enable_property_namespacing', 'enablePropertyNamespacing', False),
+    ('namespace_strategy', 'namespace_strategy', 'namespaceStrategy', 'vault'),
+    ('folder_namespace_mappings', 'folder_namespace_mappings', 'folderNamespaceMappings', None),
+
+    # Episode source description
+    ('source_description', 'source_description', 'sourceDescription', None),
+    # Issue #11: configurable frontmatter key for source_description override
+    ('source_description_key', 'source_description_key', 'sourceDescriptionKey', None),
+
+    # Extraction instruction overrides
+    ('global_extraction_instructions', 'global_extraction_instructions', 'globalExtractionInstructions', None),
+
+    # Optional namespace override (mirrors source_description pass-through)
+    ('group_id', 'group_id', 'groupId', None),
 
+    # Episode body field filtering (Phases 2 + 3)
+    ('globally_ignored_fields', 'globally_ignored_fields', 'globallyIgnoredFields', None),
+    ('property_inclusion_mode', 'property_inclusion_mode', 'propertyInclusionMode', 'permissive'),
+    ('enabled_properties', 'enabled_properties', 'enabledProperties', None),
+
+    # Prior episode context cap (Phase 3 token-cost fix)
+    ('previous_episodes_limit', 'previous_episodes_limit', 'previousEpisodesLimit', 2),
+
+    # Wikilink extraction hints (Phase 5)
+    ('wikilink_extraction_hints', 'wikilink_extraction_hints', 'wikilinkExtractionHints', True),
 
-@dataclass
+    # Episode contributor
+    ('episode_contributor', 'episode_contributor', 'episodeContributor', None),
+
+    # WebSocket Configuration for Extended MCP
+    ('ws_port', 'ws_port', 'wsPort', 8765),
+    ('ws_auth_token', 'ws_auth_token', 'wsAuthToken', ''),
+)
+
+# Fields where a present snake_case key wins even when falsy (False, 0, [], '');
+# every other field falls through to its camelCase key on a falsy snake_case value
+_SNAKE_KEY_PRESENCE_FIELDS = frozenset((
+    'globally_ignored_fields', 'property_inclusion_mode', 'enabled_properties',
+    'previous_episodes_limit', 'wikilink_extraction_hints', 'episode_contributor',
+    'probe_embedder',
+))
+
+# Fields where an empty string is normalized to None
+_BLANK_AS_NONE_FIELDS = ('source_description_key', 'global_extraction_instructions', 'episode_contributor')
+
+# Provider/database selectors compared against literals throughout the bridge. Interning the
+# parsed values lets those comparisons hit CPython's identity fast path.
+_INTERNED_FIELDS = ('llm_provider', 'embedder_provider', 'database_type')
+
+# Fallback database URL per database type (anything unrecognized is treated as Neo4j)
+_DEFAULT_DATABASE_URLS = {
+    'neo4j': 'bolt://localhost:7687',
+    'falkordb': 'falkor://localhost:6379',
+}
+
+# Provider name -> environment variable expected by that provider's SDK
+_LLM_ENV_KEYS = {
+    'openai': 'OPENAI_API_KEY',
+    'anthropic': 'ANTHROPIC_API_KEY',
+    'google': 'GOOGLE_API_KEY',
+    'groq': 'GROQ_API_KEY',
+    'venice': 'VENICE_API_KEY',
+    'openrouter': 'OPENROUTER_API_KEY',
+}
+_EMBEDDER_ENV_KEYS = {
+    'openai': 'OPENAI_API_KEY',
+    'voyage': 'VOYAGE_API_KEY',
+}
+
+# Above this many notes, validate() fans existence checks out to a thread pool
+_PARALLEL_STAT_THRESHOLD = 16
+
+# Above this many notes, validate() walks the vault once instead of stat()ing each note
+_VAULT_SCAN_THRESHOLD = 100
+
+
+
+@dataclass(slots=True)
 class BridgeConfig:
     """Configuration container for Graphiti Bridge"""
 
@@ -58,6 +189,9 @@ class BridgeConfig:
     # Optional Processing settings
     batch_size: int = 10
     max_retries: int = 3
+    max_concurrency: int = 1  # Notes processed at once in multi-note runs (opt-in, may duplicate entities)
+    batch_embeddings: bool = False  # Coalesce embedding calls (see batching_embedder.py)
+    probe_embedder: Optional[bool] = None  # Debug sample embedding; None = only for local ollama
     timeout: int = 30
     debug: bool = False
 
@@ -105,125 +239,69 @@ class BridgeConfig:
     ws_auth_token: str = ""
     graph_view_id: str = "vault"
 
+    # Effective API keys, resolved once in __post_init__ (api_keys and legacy keys don't change after construction)
+    _effective_llm_api_key: str = field(default='', init=False, repr=False, compare=False)
+    _effective_embedder_api_key: str = field(default='', init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Try new api_keys format first, then fall back to legacy format
+        if self.api_keys and self.llm_provider in self.api_keys:
+            self._effective_llm_api_key = self.api_keys[self.llm_provider]
+        else:
+            self._effective_llm_api_key = self.llm_api_key or ''
+
+        # Embedder falls back to legacy embedder key, then to the LLM key
+        if self.api_keys and self.embedder_provider in self.api_keys:
+            self._effective_embedder_api_key = self.api_keys[self.embedder_provider]
+        else:
+            self._effective_embedder_api_key = self.embedder_api_key or self._effective_llm_api_key
+
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'BridgeConfig':
         """Create BridgeConfig from dictionary (JSON input)"""
 
         # Handle both new (snake_case) and old (camelCase) field naming
-        return cls(
-            # LLM Configuration
-            llm_provider=config_dict.get(
-                'llm_provider') or config_dict.get('llmProvider', 'openai'),
-            llm_model=config_dict.get(
-                'llm_model') or config_dict.get('llmModel', 'gpt-4o'),
-            llm_small_model=config_dict.get(
-                'llm_small_model') or config_dict.get('llmSmallModel'),
-
-            # Embedder Configuration
-            embedder_provider=config_dict.get(
-                'embedder_provider') or config_dict.get('embedderProvider', 'openai'),
-            embedding_model=config_dict.get('embedding_model') or config_dict.get(
-                'embeddingModel', 'text-embedding-3-small'),
-
-            # Database Configuration
-            database_type=config_dict.get(
-                'database_type') or config_dict.get('databaseType', 'neo4j'),
-            database_url=cls._get_database_url_from_config(config_dict),
-            database_username=cls._get_database_field(
-                config_dict, 'database_username', 'databaseUsername', 'neo4j'),
-            database_password=cls._get_database_field(
-                config_dict, 'database_password', 'databasePassword', ''),
-            database_name=config_dict.get(
-                'database_name') or config_dict.get('databaseName', 'neo4j'),
-
-            # Provider-specific API keys (new format)
-            api_keys=config_dict.get('api_keys'),
-
-            # Legacy API keys (backward compatibility)
-            llm_api_key=config_dict.get(
-                'llm_api_key') or config_dict.get('llmApiKey', ''),
-            embedder_api_key=config_dict.get(
-                'embedder_api_key') or config_dict.get('embedderApiKey'),
-
-            # Provider-specific settings
-            azure_endpoint=config_dict.get(
-                'azure_endpoint') or config_dict.get('azureEndpoint'),
-            azure_api_version=config_dict.get(
-                'azure_api_version') or config_dict.get('azureApiVersion'),
-            ollama_base_url=config_dict.get(
-                'ollama_base_url') or config_dict.get('ollamaBaseUrl'),
-            openrouter_preset_slug=config_dict.get(
-                'openrouter_preset_slug') or config_dict.get('openrouterPresetSlug'),
-            openrouter_use_preset_with_custom_model=config_dict.get(
-                'openrouter_use_preset_with_custom_model') or config_dict.get('openrouterUsePresetWithCustomModel', False),
-
-            # Processing Configuration
-            models_path=config_dict.get(
-                'models_path') or config_dict.get('modelsPath'),
-            vault_path=config_dict.get(
-                'vault_path') or config_dict.get('vaultPath'),
-            notes=config_dict.get('notes', []),
-
-            # Optional settings
-            batch_size=config_dict.get(
-                'batch_size') or config_dict.get('batchSize', 10),
-            max_retries=config_dict.get(
-                'max_retries') or config_dict.get('maxRetries', 3),
-            timeout=config_dict.get('timeout', 30),
-            debug=config_dict.get('debug') or config_dict.get(
-                'debugMode', False),
-
-            # Episode and Ontology Configuration
-            use_custom_ontology=config_dict.get(
-                'use_custom_ontology') or config_dict.get('useCustomOntology', False),
-            use_bulk_sync=config_dict.get(
-                'use_bulk_sync') or config_dict.get('useBulkSync', False),
-            default_namespace=config_dict.get(
-                'default_namespace') or config_dict.get('defaultNamespace', 'vault'),
-            enable_folder_namespacing=config_dict.get(
-                'enable_folder_namespacing') or config_dict.get('enableFolderNamespacing', False),
-            enable_property_namespacing=config_dict.get(
-                'enable_property_namespacing') or config_dict.get('enablePropertyNamespacing', False),
-            namespace_strategy=config_dict.get(
-                'namespace_strategy') or config_dict.get('namespaceStrategy', 'vault'),
-            folder_namespace_mappings=config_dict.get(
-                'folder_namespace_mappings') or config_dict.get('folderNamespaceMappings', []),
-
-            # Episode source description
-            source_description=config_dict.get(
-                'source_description') or config_dict.get('sourceDescription'),
-
-            # Issue #11: configurable frontmatter key for source_description override
-            source_description_key=config_dict.get('source_description_key') or config_dict.get('sourceDescriptionKey') or None,
-
-            # Extraction instruction overrides
-            global_extraction_instructions=config_dict.get('global_extraction_instructions') or config_dict.get('globalExtractionInstructions') or None,
-
-            # Optional namespace override (mirrors source_description pass-through)
-            group_id=config_dict.get('group_id') or config_dict.get('groupId'),
-
-            # Episode body field filtering (Phases 2 + 3)
-            globally_ignored_fields=config_dict.get('globally_ignored_fields', config_dict.get('globallyIgnoredFields', ['cssclass', 'mm_uid', 'mm_sync'])),
-            property_inclusion_mode=config_dict.get('property_inclusion_mode', config_dict.get('propertyInclusionMode', 'permissive')),
-            enabled_properties=config_dict.get('enabled_properties', config_dict.get('enabledProperties')),
-
-            # Prior episode context cap (Phase 3 token-cost fix)
-            previous_episodes_limit=int(config_dict.get('previous_episodes_limit', config_dict.get('previousEpisodesLimit', 2))),
-
-            # Wikilink extraction hints (Phase 5)
-            wikilink_extraction_hints=config_dict.get('wikilink_extraction_hints', config_dict.get('wikilinkExtractionHints', True)),
-
-            # Episode contributor
-            episode_contributor=config_dict.get('episode_contributor', config_dict.get('episodeContributor')) or None,
-
-            # WebSocket Configuration for Extended MCP
-            ws_port=config_dict.get(
-                'ws_port') or config_dict.get('wsPort', 8765),
-            ws_auth_token=config_dict.get(
-                'ws_auth_token') or config_dict.get('wsAuthToken', ''),
-            graph_view_id=config_dict.get('graph_view_id') or config_dict.get(
-                'graphViewId') or config_dict.get('defaultNamespace', 'vault')
-        )
+        kwargs: Dict[str, Any] = {}
+        for attr, snake_key, camel_key, default in _CONFIG_FIELDS:
+            if attr in _SNAKE_KEY_PRESENCE_FIELDS:
+                kwargs[attr] = config_dict[snake_key] if snake_key in config_dict else config_dict.get(camel_key, default)
+            else:
+                kwargs[attr] = config_dict.get(snake_key) or config_dict.get(camel_key, default)
+
+        for attr in _INTERNED_FIELDS:
+            if isinstance(kwargs[attr], str):
+                kwargs[attr] = sys.intern(kwargs[attr])
+
+        # Empty strings mean "not set" for these pass-through overrides
+        for attr in _BLANK_AS_NONE_FIELDS:
+            kwargs[attr] = kwargs[attr] or None
+
+        # List defaults are built per call so instances never share a mutable default
+        if kwargs['folder_namespace_mappings'] is None:
+            kwargs['folder_namespace_mappings'] = []
+        if kwargs['globally_ignored_fields'] is None:
+            kwargs['globally_ignored_fields'] = ['cssclass', 'mm_uid', 'mm_sync']
+
+        # Prior episode context cap (Phase 3 token-cost fix)
+        kwargs['previous_episodes_limit'] = int(kwargs['previous_episodes_limit'])
+
+        # Database Configuration
+        kwargs['database_url'] = cls._get_database_url_from_config(config_dict)
+        kwargs['database_username'] = cls._get_database_field(
+            config_dict, 'database_username', 'databaseUsername', 'neo4j')
+        kwargs['database_password'] = cls._get_database_field(
+            config_dict, 'database_password', 'databasePassword', '')
+
+        # Single-key fields
+        kwargs['api_keys'] = config_dict.get('api_keys')
+        kwargs['notes'] = config_dict.get('notes', [])
+        kwargs['timeout'] = config_dict.get('timeout', 30)
+
+        # WebSocket Configuration for Extended MCP (falls back to the default namespace)
+        kwargs['graph_view_id'] = config_dict.get('graph_view_id') or config_dict.get(
+            'graphViewId') or config_dict.get('defaultNamespace', 'vault')
+
+        return cls(**kwargs)
 
     @classmethod
     def _get_database_field(cls, config_dict: Dict[str, Any], snake_key: str, camel_key: str, default_value: str) -> Optional[str]:
@@ -270,24 +348,16 @@ class BridgeConfig:
         # Priority 2: Database-specific configuration based on type
         database_type = config_dict.get(
             'database_type') or config_dict.get('databaseType', 'neo4j')
-        database_configs = config_dict.get('databaseConfigs', {})
-
-        if database_type == 'neo4j' and 'neo4j' in database_configs:
-            neo4j_config = database_configs['neo4j']
-            neo4j_uri = neo4j_config.get('uri')
-            if neo4j_uri:
-                return neo4j_uri
-        elif database_type == 'falkordb' and 'falkordb' in database_configs:
-            falkor_config = database_configs['falkordb']
-            host = falkor_config.get('host', 'localhost')
-            port = falkor_config.get('port', 6379)
-            return f"falkor://{host}:{port}"
+        db_config = config_dict.get('databaseConfigs', {}).get(database_type)
+
+        if db_config:
+            if database_type == 'falkordb':
+                return f"falkor://{db_config.get('host', 'localhost')}:{db_config.get('port', 6379)}"
+            if database_type == 'neo4j' and db_config.get('uri'):
+                return db_config['uri']
 
         # Priority 3: Fallback defaults based on database type
-        if database_type == 'falkordb':
-            return "falkor://localhost:6379"
-        else:  # neo4j default
-            return "bolt://localhost:7687"
+        return _DEFAULT_DATABASE_URLS['falkordb' if database_type == 'falkordb' else 'neo4j']
 
         # @vessel-close:Heimdall
 
@@ -334,40 +404,59 @@ class BridgeConfig:
                     "Ollama base URL is required for Ollama provider")
 
         # Path validation - check whichever path is provided
-        if self.models_path and not Path(self.models_path).exists():
+        if self.models_path and not os.path.exists(self.models_path):
             errors.append(f"Models path does not exist: {self.models_path}")
 
-        if self.vault_path and not Path(self.vault_path).exists():
+        vault_exists = bool(self.vault_path) and os.path.exists(self.vault_path)
+        if self.vault_path and not vault_exists:
             errors.append(f"Vault path does not exist: {self.vault_path}")
+            # Notes would be resolved against a directory known to be missing -
+            # report once instead of stat()ing every note
+            if self.notes:
+                errors.append("Cannot validate notes: base path missing")
+            return errors
+
+        # File validation - make paths relative to vault_path if provided (cwd otherwise)
+        # Plain os.path calls: no Path object is built per note
+        vault_base = self.vault_path or os.getcwd()
 
-        # File validation - make paths relative to vault_path if provided
-        vault_base = Path(self.vault_path) if self.vault_path else Path.cwd()
-        for note_path in self.notes:
+        def note_exists(note_path: str) -> bool:
             # Try absolute path first, then relative to vault
-            note_file = Path(note_path)
-            if not note_file.exists():
-                # Try relative to vault path
-                vault_relative = vault_base / note_path
-                if not vault_relative.exists():
-                    errors.append(f"Note file does not exist: {note_path}")
+            return os.path.exists(note_path) or os.path.exists(os.path.join(vault_base, note_path))
+
+        notes_to_check = self.notes
+        if vault_exists and len(self.notes) > _VAULT_SCAN_THRESHOLD:
+            # One directory walk is cheaper than a stat() per note for large batches;
+            # only notes not found in the vault listing fall through to individual checks
+            present = set()
+            for root, _dirs, files in os.walk(self.vault_path):
+                rel_root = os.path.relpath(root, self.vault_path)
+                present.update(
+                    os.path.join(rel_root, f) if rel_root != '.' else f for f in files)
+            notes_to_check = [
+                note_path for note_path in self.notes if os.path.normpath(note_path) not in present]
+
+        if len(notes_to_check) > _PARALLEL_STAT_THRESHOLD:
+            # stat() releases the GIL, so a thread fan-out overlaps the syscalls
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(32, len(notes_to_check))) as pool:
+                notes_found = list(pool.map(note_exists, notes_to_check))
+        else:
+            notes_found = [note_exists(note_path) for note_path in notes_to_check]
+
+        for note_path, found in zip(notes_to_check, notes_found):
+            if not found:
+                errors.append(f"Note file does not exist: {note_path}")
 
         return errors
 
     def get_effective_llm_api_key(self) -> str:
         """Get the API key to use for LLM from new or legacy format"""
-        # Try new api_keys format first
-        if self.api_keys and self.llm_provider in self.api_keys:
-            return self.api_keys[self.llm_provider]
-        # Fall back to legacy format
-        return self.llm_api_key or ''
+        return self._effective_llm_api_key
 
     def get_effective_embedder_api_key(self) -> str:
         """Get the API key to use for embedder (fallback to LLM key if not provided)"""
-        # Try new api_keys format first
-        if self.api_keys and self.embedder_provider in self.api_keys:
-            return self.api_keys[self.embedder_provider]
-        # Fall back to legacy format, then to LLM key
-        return self.embedder_api_key or self.get_effective_llm_api_key()
+        return self._effective_embedder_api_key
 
     def get_database_uri(self) -> str:
         """Get the properly formatted database URI"""
@@ -399,7 +488,9 @@ class BridgeConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Converts the dataclass to a dictionary, redacting sensitive information."""
-        d = asdict(self)
+        # Shallow field copy; asdict() would deep-copy notes only for them to be summarized below
+        # Internal caches (init=False) are skipped - they hold resolved API keys
+        d = {f.name: getattr(self, f.name) for f in fields(self) if f.init and f.name != 'notes'}
         # Redact sensitive fields for safe logging
         if d.get('api_keys'):
             d['api_keys'] = {
@@ -414,25 +505,25 @@ class BridgeConfig:
             d['ws_auth_token'] = 'REDACTED'
 
         # Summarize long lists
-        if 'notes' in d and isinstance(d['notes'], list):
-            d['notes'] = f"[{len(d['notes'])} notes]"
+        d['notes'] = f"[{len(self.notes)} notes]" if isinstance(self.notes, list) else self.notes
 
         return d
 
 
 def load_config_from_stdin() -> BridgeConfig:
     """Load configuration from stdin JSON"""
-    import sys
-
     try:
-        stdin_raw = sys.stdin.read().strip()
+        # Read raw bytes so the parser decodes directly (no str round-trip)
+        stdin_stream = getattr(sys.stdin, 'buffer', sys.stdin)
+        stdin_raw = stdin_stream.read().lstrip()
 
-        # Parse JSON configuration without debug output to prevent contamination
-        config_data = json.loads(stdin_raw)
+        # Handle potential double JSON encoding: a payload starting with '"' is a JSON
+        # string literal wrapping the real object, so unwrap it before the main parse
+        if stdin_raw[:1] in (b'"', '"'):
+            stdin_raw = _json_loads(stdin_raw)
 
-        # Handle potential double JSON encoding
-        if isinstance(config_data, str):
-            config_data = json.loads(config_data)
+        # Parse JSON configuration without debug output to prevent contamination
+        config_data = _json_loads(stdin_raw)
 
         # Ensure we have a dictionary
         if not isinstance(config_data, dict):
@@ -450,8 +541,8 @@ def load_config_from_stdin() -> BridgeConfig:
 def load_config_from_file(file_path: str) -> BridgeConfig:
     """Load configuration from JSON file"""
     try:
-        with open(file_path, 'r') as f:
-            config_data = json.load(f)
+        with open(file_path, 'rb') as f:
+            config_data = _json_loads(f.read())
         return BridgeConfig.from_dict(config_data)
     except FileNotFoundError:
         raise ValueError(f"Configuration file not found: {file_path}")
@@ -459,39 +550,34 @@ def load_config_from_file(file_path: str) -> BridgeConfig:
         raise ValueError(f"Invalid JSON in configuration file: {e}")
 
 
+def _set_env(key: str, value: str):
+    """Set an environment variable only if it differs (each write updates the OS env block)"""
+    if os.environ.get(key) != value:
+        os.environ[key] = value
+
+
 def setup_environment_variables(config: BridgeConfig):
     """Set up environment variables for providers that need them"""
 
     # Set database name for Graphiti (fixes default_db issue)
-    os.environ['DEFAULT_DATABASE'] = config.database_name
+    _set_env('DEFAULT_DATABASE', config.database_name)
 
     # Set API keys as environment variables for providers that expect them
-    llm_api_key = config.get_effective_llm_api_key()
-    if config.llm_provider == 'openai':
-        os.environ['OPENAI_API_KEY'] = llm_api_key
-    elif config.llm_provider == 'anthropic':
-        os.environ['ANTHROPIC_API_KEY'] = llm_api_key
-    elif config.llm_provider == 'google':
-        os.environ['GOOGLE_API_KEY'] = llm_api_key
-    elif config.llm_provider == 'groq':
-        os.environ['GROQ_API_KEY'] = llm_api_key
-    elif config.llm_provider == 'venice':
-        os.environ['VENICE_API_KEY'] = llm_api_key
-    elif config.llm_provider == 'openrouter':
-        os.environ['OPENROUTER_API_KEY'] = llm_api_key
+    llm_env_name = _LLM_ENV_KEYS.get(config.llm_provider)
+    if llm_env_name:
+        _set_env(llm_env_name, config.get_effective_llm_api_key())
 
     # Set embedder API keys
-    embedder_key = config.get_effective_embedder_api_key()
-    if config.embedder_provider == 'openai':
-        os.environ['OPENAI_API_KEY'] = embedder_key
-    elif config.embedder_provider == 'voyage':
-        os.environ['VOYAGE_API_KEY'] = embedder_key
+    embedder_env_name = _EMBEDDER_ENV_KEYS.get(config.embedder_provider)
+    if embedder_env_name:
+        _set_env(embedder_env_name, config.get_effective_embedder_api_key())
 
     # Set debug flag
     if config.debug:
-        os.environ['GRAPHITI_BRIDGE_DEBUG'] = '1'
+        _set_env('GRAPHITI_BRIDGE_DEBUG', '1')
 
 
+@functools.lru_cache(maxsize=1)
 def get_vault_path() -> Optional[str]:
-    """Get vault path from environment variable"""
+    """Get vault path from environment variable (read once; the env is fixed for the process lifetime)"""
     return os.environ.get('OBSIDIAN_VAULT_PATH')
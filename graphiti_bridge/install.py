@@ -7,6 +7,8 @@ This script automatically detects available package managers and installs graphi
 with the appropriate extras based on user configuration.
 """
 
+import compileall
+import re
 import subprocess
 import sys
 import json
@@ -15,6 +17,13 @@ import argparse
 import io
 from typing import List, Dict, Any
 
+# Minimum graphiti-core version the bridge supports
+GRAPHITI_MIN_VERSION = "0.18.0"
+
+# Plugin requirements file that pins the graphiti-core version shipped with this release
+REQUIREMENTS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'mcp-server', 'requirements.txt')
+
 # Force UTF-8 encoding for Windows compatibility
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
@@ -62,16 +71,37 @@ def build_extras_list(config: Dict[str, Any]) -> List[str]:
     return all_extras
 
 
+def get_graphiti_requirement() -> str:
+    """Return the graphiti-core version specifier pinned in requirements.txt (e.g. '>=0.29.0,<0.30.0').
+    Only used to decide whether pip can be skipped; falls back to the GRAPHITI_MIN_VERSION
+    floor if the file or the line is missing."""
+    try:
+        with open(REQUIREMENTS_PATH, encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if not line.startswith('graphiti-core'):
+                    continue
+                spec = line[len('graphiti-core'):].strip()
+                if spec.startswith('['):
+                    # Drop the extras; only the version specifier is compared
+                    spec = spec[spec.index(']') + 1:].strip()
+                if spec:
+                    return spec.replace(' ', '')
+    except (OSError, ValueError):
+        pass
+    return f">={GRAPHITI_MIN_VERSION}"
+
+
 def install_graphiti(package_manager: str, extras: List[str]):
     """Install graphiti-core with specified extras using detected package manager"""
 
     # Build package specification
     if extras:
         extras_str = ','.join(extras)
-        package_spec = f"graphiti-core[{extras_str}]>=0.18.0"
+        package_spec = f"graphiti-core[{extras_str}]>={GRAPHITI_MIN_VERSION}"
         print(f"Installing graphiti-core with extras: {extras_str}")
     else:
-        package_spec = "graphiti-core>=0.18.0"
+        package_spec = f"graphiti-core>={GRAPHITI_MIN_VERSION}"
         print("Installing graphiti-core (no extras)")
 
     # Build installation command (simplified to use only pip)
@@ -82,56 +112,114 @@ def install_graphiti(package_manager: str, extras: List[str]):
     sys.stdout.flush()  # Force output to appear immediately
 
     try:
-        # Run installation with real-time output
-        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                   text=True, bufsize=1, universal_newlines=True)
-
-        # Stream output line by line
-        if process.stdout:
-            for line in process.stdout:
-                line = line.rstrip()
-                if line:
-                    print(f"  {line}")
-                    sys.stdout.flush()
-
-        # Wait for process to complete
-        returncode = process.wait()
-
-        if returncode == 0:
-            print("✓ Installation completed successfully")
-            return True
-        else:
-            print(f"❌ Installation failed with exit code {returncode}")
-            raise subprocess.CalledProcessError(returncode, cmd)
+        # Run installation with real-time output: pip inherits our stdout (stderr merged into it),
+        # so its output reaches the caller directly instead of being relayed line by line
+        subprocess.run(cmd, stdout=None, stderr=subprocess.STDOUT, check=True)
+
+        print("✓ Installation completed successfully")
+        return True
 
     except subprocess.CalledProcessError as e:
         print(f"❌ Installation failed with exit code {e.returncode}")
         raise
 
 
+def get_installed_graphiti_version(requirement: str):
+    """Return the installed graphiti-core version if it satisfies requirement, else None"""
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        installed = version('graphiti-core')
+    except PackageNotFoundError:
+        return None
+
+    try:
+        from packaging.specifiers import SpecifierSet
+        satisfied = SpecifierSet(requirement).contains(installed, prereleases=True)
+    except ImportError:
+        # packaging unavailable: compare the leading numeric release components
+        def release(v):
+            parts = []
+            for part in v.split('.')[:3]:
+                digits = ''.join(ch for ch in part if ch.isdigit())
+                parts.append(int(digits) if digits else 0)
+            return tuple(parts)
+        checks = {
+            '>=': lambda a, b: a >= b, '<=': lambda a, b: a <= b,
+            '==': lambda a, b: a == b, '!=': lambda a, b: a != b,
+            '>': lambda a, b: a > b, '<': lambda a, b: a < b,
+        }
+        satisfied = True
+        for clause in requirement.split(','):
+            op = next((op for op in checks if clause.startswith(op)), None)
+            if op is None:
+                # Unsupported operator (e.g. ~=): let pip decide
+                return None
+            satisfied = satisfied and checks[op](release(installed), release(clause[len(op):]))
+    except Exception:
+        return None
+
+    return installed if satisfied else None
+
+
+def get_missing_extras(extras: List[str]) -> List[str]:
+    """Return the extras whose packages are not installed, per graphiti-core's own metadata"""
+    from importlib.metadata import requires, version, PackageNotFoundError
+    try:
+        requirements = requires('graphiti-core') or []
+    except PackageNotFoundError:
+        return list(extras)
+
+    # Extra names compare normalized (PEP 685): case-insensitive, '-', '_' and '.' equivalent
+    def normalize(name):
+        return re.sub(r'[-_.]+', '-', name).lower()
+
+    wanted = {normalize(extra): extra for extra in extras}
+    missing = set()
+    for requirement in requirements:
+        spec, _, marker = requirement.partition(';')
+        match = re.search(r'extra\s*==\s*["\']([^"\']+)["\']', marker)
+        if not match or normalize(match.group(1)) not in wanted:
+            continue
+        package = re.match(r'\s*([A-Za-z0-9][A-Za-z0-9._-]*)', spec).group(1)
+        try:
+            version(package)
+        except PackageNotFoundError:
+            missing.add(wanted[normalize(match.group(1))])
+    return sorted(missing)
+
+
 def verify_installation():
     """Verify that graphiti-core was installed correctly"""
+    # Read the installed distribution metadata instead of importing graphiti_core,
+    # which would pull in its whole dependency tree (neo4j, openai, provider SDKs)
+    from importlib.metadata import version, PackageNotFoundError
     try:
-        import graphiti_core
-        # Try to get version, fallback to "installed" if not available
-        try:
-            version = graphiti_core.__version__
-            print(f"✓ graphiti-core {version} imported successfully")
-        except AttributeError:
-            print("✓ graphiti-core imported successfully")
-
-        # Test basic functionality
-        from graphiti_core import Graphiti
-        print("✓ Graphiti class available")
+        installed_version = version('graphiti-core')
+        print(f"✓ graphiti-core {installed_version} installed")
         return True
-    except ImportError as e:
-        print(f"❌ Failed to import graphiti-core: {e}")
+    except PackageNotFoundError:
+        print("❌ graphiti-core package metadata not found")
         return False
     except Exception as e:
         print(f"❌ Error during verification: {e}")
         return False
 
 
+def precompile_bridge():
+    """Byte-compile the bridge sources so cold starts skip parsing them"""
+    # Writes to __pycache__ rather than legacy side-by-side .pyc files: the
+    # interpreter ignores sourceless .pyc files while the .py is still present
+    bridge_dir = os.path.dirname(os.path.abspath(__file__))
+    try:
+        if compileall.compile_dir(bridge_dir, maxlevels=0, quiet=1):
+            print("✓ Bridge bytecode precompiled")
+        else:
+            print("⚠️  Some bridge modules could not be precompiled")
+    except OSError as e:
+        # Read-only plugin directory: Python will compile on first import instead
+        print(f"⚠️  Skipping bytecode precompile: {e}")
+
+
 def main():
     """Main installation process"""
     try:
@@ -146,6 +234,8 @@ def main():
                             help='Database type (neo4j, falkordb)')
         parser.add_argument('--json-config', type=str,
                             help='JSON configuration string (alternative to individual args)')
+        parser.add_argument('--force', action='store_true',
+                            help='Run pip even if a compatible graphiti-core is already installed')
 
         args = parser.parse_args()
 
@@ -166,6 +256,26 @@ def main():
         print("\n📋 Checking Python environment...")
         check_python_environment()
 
+        # Skip pip's dependency resolution entirely when the installed version matches the
+        # one this plugin release pins; a plugin update that bumps the pin reinstalls
+        requirement = get_graphiti_requirement()
+        installed_version = None if args.force else get_installed_graphiti_version(requirement)
+        # A graphiti-core installed without the provider extras still needs pip for their SDKs
+        missing_extras = get_missing_extras(build_extras_list(config)) if installed_version else []
+        if missing_extras:
+            print(f"\ngraphiti-core {installed_version} is installed but missing extras: {', '.join(missing_extras)}")
+        elif installed_version:
+            print(f"\n✓ graphiti-core {installed_version} already installed ({requirement}), skipping pip install")
+            print("  Use --force to reinstall or upgrade.")
+            print("\n✅ Verifying installation...")
+            if verify_installation():
+                precompile_bridge()
+                print("\n🎉 Installation completed successfully!")
+                print("\nGraphiti Bridge is ready to use.")
+                return 0
+            print("\n❌ Installation verification failed")
+            return 1
+
         # Step 2: Detect package manager
         print("\n🔍 Detecting package manager...")
         package_manager = detect_package_manager()
@@ -186,6 +296,7 @@ def main():
         # Step 5: Verify installation
         print("\n✅ Verifying installation...")
         if verify_installation():
+            precompile_bridge()
             print("\n🎉 Installation completed successfully!")
             print("\nGraphiti Bridge is ready to use.")
             return 0
@@ -1,28 +1,16 @@
 """
 Lazy import wrapper for heavy dependencies.
 Only loads modules when they're actually used.
-"""
-import sys
-import time
-
 
-class LazyModule:
-    """Lazy loader for expensive modules"""
-
-    def __init__(self, module_name):
-        self.module_name = module_name
-        self._module = None
+Importing this module must stay free of side effects beyond defining names:
+no provider imports, file access or threads at import time. That keeps it
+cheap to load and safe to ship precompiled or from a zip archive; install.py
+byte-compiles the bridge after installation for the same reason.
+"""
+import functools
 
-    def __getattr__(self, attr):
-        if self._module is None:
-            start = time.time()
-            print(
-                f"[LAZY-LOAD] Loading {self.module_name} on first use...", file=sys.stderr)
-            self._module = __import__(self.module_name, fromlist=[''])
-            print(
-                f"[LAZY-LOAD] {self.module_name} loaded in {time.time() - start:.2f}s", file=sys.stderr)
-        return getattr(self._module, attr)
 
+@functools.lru_cache(maxsize=None)
 def get_gemini_embedder():
     """Load Gemini embedder only when needed"""
     try:
@@ -32,6 +20,7 @@ def get_gemini_embedder():
         return None, None
 
 
+@functools.lru_cache(maxsize=None)
 def get_voyage_embedder():
     """Load Voyage embedder only when needed"""
     try:
@@ -41,6 +30,7 @@ def get_voyage_embedder():
         return None, None
 
 
+@functools.lru_cache(maxsize=None)
 def get_azure_embedder():
     """Load Azure embedder only when needed"""
     try:
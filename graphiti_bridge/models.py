@@ -6,14 +6,244 @@ for Graphiti custom ontology episodes.
 """
 
 import os
+import sys
 import json
+import hashlib
 import logging
+import functools
 import threading
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Type, Union
 from pathlib import Path
 from datetime import datetime
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 from pydantic import BaseModel, Field, create_model
 
+# orjson parses straight from bytes; fall back to stdlib json when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+
+# Optional incremental parser for very large ontology sources (e.g. a pre-migration
+# data.json carrying the whole plugin state)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_STREAM_PARSE_THRESHOLD = 8 * 1024 * 1024
+
+# Top-level keys load_models actually reads
+_ONTOLOGY_KEYS = frozenset({
+    'entityDescriptions', 'propertyDescriptions', 'edgeTypes', 'edgeTypeMap', 'propertySelections'
+})
+
+
+# Opt-in msgspec mirrors of the generated models for validation-only consumers
+_USE_MSGSPEC = os.environ.get('MEGAMEM_USE_MSGSPEC') == '1'
+msgspec = None
+if _USE_MSGSPEC:
+    try:
+        import msgspec
+    except ImportError:
+        _USE_MSGSPEC = False
+
+
+def _load_json(path: Path) -> Any:
+    """Read and parse a JSON file in a single bytes read"""
+    return _json_loads(path.read_bytes())
+
+
+def _load_ontology(path: Path, size: int) -> Dict[str, Any]:
+    """Load the ontology sections of path, streaming only the needed keys from large files"""
+    if ijson is None or size <= _STREAM_PARSE_THRESHOLD:
+        return _load_json(path)
+    with open(path, 'rb') as f:
+        return {key: value for key, value in ijson.kvitems(f, '', use_float=True)
+                if key in _ONTOLOGY_KEYS}
+
+
+def _intern_text(value: Any) -> Any:
+    """Intern description strings so identical ones across types share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# Ontology fieldType string -> Python type, built once rather than per property
+_TYPE_MAPPING: Dict[str, Type] = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'datetime': datetime,
+    'List[str]': List[str],
+    'List[int]': List[int],
+    'List[float]': List[float]
+}
+
+# Optional[...] of each mapped type, so property loops skip typing's Union construction
+_OPTIONAL_TYPES: Dict[Type, Any] = {t: Optional[t] for t in _TYPE_MAPPING.values()}
+
+# Field templates for the built-in entity types, used when an entity has no
+# enabled properties. Built once at import; treat as read-only.
+_STANDARD_ENTITY_FIELDS: Dict[str, Dict[str, tuple]] = {
+    "Person": {
+        'givenName': (Optional[str], Field(None, description="Given name or first name of the person as commonly used in introductions and personal identification")),
+        'familyName': (Optional[str], Field(None, description="Family name, surname, or last name of the person used for formal identification and family lineage")),
+        'c_name': (Optional[str], Field(None, description="Complete legal name including all given names, middle names, and family names as appears on official documents")),
+        'aliases': (Optional[List[str]], Field(None, description="Alternative names, nicknames, professional names, or pseudonyms by which the person is also known")),
+        'identity_type': (Optional[str], Field(None, description="Classification of person's legal and social identity status (natural_person, national_identity, pseudonym)")),
+        'birthDate': (Optional[datetime], Field(None, description="Date when the person was born in YYYY-MM-DD format for biographical and age calculation purposes")),
+        'address': (Optional[str], Field(None, description="Physical address, city, state, or geographic location where the person currently resides or is primarily based")),
+        'email': (Optional[str], Field(None, description="Primary email address used for professional or personal communication and contact purposes")),
+        'worksFor': (Optional[str], Field(None, description="Organization, company, or institution where the person is currently employed or holds a primary professional role")),
+        'jobTitle': (Optional[str], Field(None, description="Current professional role, position, or title that describes the person's responsibilities and level within an organization")),
+        'url': (Optional[str], Field(None, description="Personal website, professional profile, or primary online presence URL that represents the person")),
+        'needs': (Optional[str], Field(None, description="Specific resources, skills, connections, or support that the person requires to achieve their goals or be successful")),
+        'offers': (Optional[str], Field(None, description="Skills, services, knowledge, resources, or value that the person can provide to others or contribute to projects")),
+        'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs that identify the same person on other platforms, databases, or knowledge systems for entity linking"))
+    },
+    "Organization": {
+        'c_name': (Optional[str], Field(None, description="Complete legal name of the organization as registered with government authorities or incorporation documents")),
+        'aliases': (Optional[List[str]], Field(None, description="Alternative names, trade names, brand names, acronyms, or abbreviations by which the organization is commonly known")),
+        'org_type': (Optional[str], Field(None, description="Legal structure and registration type of the organization (Unregistered, DAO, PMA, LLC, Inc, Partnership, 501c3, Government, etc.)")),
+        'foundingDate': (Optional[datetime], Field(None, description="Date when the organization was officially established, incorporated, or founded in YYYY-MM-DD format")),
+        'address': (Optional[str], Field(None, description="Physical headquarters address, primary business location, or registered office address of the organization")),
+        'needs': (Optional[str], Field(None, description="Resources, partnerships, talent, funding, or capabilities that the organization requires to achieve its mission and goals")),
+        'offers': (Optional[str], Field(None, description="Products, services, expertise, resources, or value propositions that the organization provides to customers or stakeholders")),
+        'url': (Optional[str], Field(None, description="Official website, primary web presence, or main digital platform representing the organization")),
+        'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs that identify the same organization on other platforms, databases, or knowledge systems for entity linking"))
+    },
+    "Technology": {
+        'c_name': (Optional[str], Field(None, description="Complete official name of the software, technology, framework, or programming language as recognized by its creators")),
+        'aliases': (Optional[List[str]], Field(None, description="Alternative names, abbreviated forms, version names, or common references used by developers and users")),
+        'category': (Optional[str], Field(None, description="Primary classification of the technology type (framework, programming language, AI model, database, API, library, platform, etc.)")),
+        'opensource': (Optional[bool], Field(None, description="Whether the technology is open source software with publicly available source code and an open source license")),
+        'url': (Optional[str], Field(None, description="Official documentation website, main project page, or primary resource URL for the technology")),
+        'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs that identify the same technology on other platforms, repositories, or knowledge systems for entity linking"))
+    },
+    "Product": {
+        'c_name': (Optional[str], Field(None, description="Complete official name of the product or service as marketed and recognized by customers and the industry")),
+        'aliases': (Optional[List[str]], Field(None, description="Alternative product names, brand variations, version names, or marketing names used across different markets or time periods")),
+        'offering_type': (Optional[str], Field(None, description="Primary business model and delivery method of the offering (product, service, platform, SaaS, API, subscription, etc.)")),
+        'category': (Optional[str], Field(None, description="Market segment, industry classification, or functional category that best describes the product's purpose and target market")),
+        'url': (Optional[str], Field(None, description="Official product page, service portal, or primary marketing website where customers can learn about or access the offering")),
+        'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs that identify the same product on other platforms, marketplaces, or knowledge systems for entity linking"))
+    },
+    "Project": {
+        'c_name': (Optional[str], Field(None, description="Complete official name of the project, initiative, or undertaking as recognized by stakeholders and participants")),
+        'aliases': (Optional[List[str]], Field(None, description="Alternative project names, codenames, working titles, or informal references used during different phases of development")),
+        'project_type': (Optional[str], Field(None, description="Classification of the project's primary purpose and methodology (research, development, initiative, startup, campaign, collaboration, etc.)")),
+        'status': (Optional[str], Field(None, description="Current phase or state of the project lifecycle (planning, active, completed, paused, cancelled, on-hold)")),
+        'needs': (Optional[str], Field(None, description="Resources, expertise, partnerships, funding, or support that the project requires to achieve its objectives and deliverables")),
+        'offers': (Optional[str], Field(None, description="Outcomes, deliverables, knowledge, tools, or value that the project will produce or contribute to its field or community")),
+        'url': (Optional[str], Field(None, description="Official project page, repository, documentation site, or primary web presence where information about the project is maintained")),
+        'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs that identify the same project on other platforms, repositories, or knowledge systems for entity linking"))
+    },
+    "WebPage": {
+        'c_name': (Optional[str], Field(None, description="Complete title or headline of the web page as it appears in the browser title bar or page header")),
+        'aliases': (Optional[List[str]], Field(None, description="Alternative titles, SEO variations, shortened versions, or social media titles used for the same content")),
+        'url': (str, Field(description="Complete web address or URL where the page can be accessed on the internet")),
+        'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs of archived versions, mirror sites, or equivalent content locations for the same web page"))
+    },
+    "Note": {
+        'note_type': (Optional[str], Field(None, description="Classification of the note's purpose and content structure (idea, analysis, reflection, meeting_notes, research, synthesis, etc.)")),
+        'author': (Optional[str], Field(None, description="Person who created, wrote, or is primarily responsible for the content and insights contained in the note")),
+        'created_date': (Optional[datetime], Field(None, description="Date when the note was originally created or when the ideas were first captured in YYYY-MM-DD format"))
+    },
+    "Article": {
+        'c_name': (Optional[str], Field(None, description="Complete title or headline of the published article as it appears in the final publication")),
+        'aliases': (Optional[List[str]], Field(None, description="Alternative titles, working titles, social media versions, or translated titles used for the same article")),
+        'article_type': (Optional[str], Field(None, description="Genre or format classification of the published content (essay, blog_post, analysis, tutorial, whitepaper, research_paper, etc.)")),
+        'author': (Optional[str], Field(None, description="Person or organization who wrote, created, or is credited as the primary author of the published article")),
+        'published_date': (Optional[datetime], Field(None, description="Date when the article was officially published or made publicly available in YYYY-MM-DD format")),
+        'url': (Optional[str], Field(None, description="Web address where the published article can be read or accessed online")),
+        'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs of archived versions, republished versions, or equivalent content locations for the same article"))
+    }
+}
+
+_STANDARD_ENTITY_DESCRIPTIONS: Dict[str, str] = {
+    "Person": "A human actor (natural person or national identity)",
+    "Organization": "An organization, company, or institution",
+    "Technology": "Technology, framework, programming language, or software",
+    "Product": "A product, service, or offering",
+    "Project": "A project, initiative, or undertaking",
+    "WebPage": "Web page, article, or documentation",
+    "Note": "Personal notes and ideas",
+    "Article": "Published articles and content"
+}
+
+# Above this many types, model generation is spread over a small thread pool
+_PARALLEL_MODEL_THRESHOLD = 8
+
+# Generated model classes keyed by a digest of the schema fragment they were built
+# from, so reloading an unchanged ontology reuses classes instead of re-running
+# pydantic's schema build for every entity and edge. Bounded LRU: long-lived processes
+# (sync daemon, MCP server) mint a new key on every schema edit
+_MODEL_CACHE: 'OrderedDict[bytes, Type]' = OrderedDict()
+_MODEL_CACHE_MAXSIZE = 512
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+# Base class for all generated entity models; identical for every ontology, so built once
+_BASE_ENTITY = create_model(
+    'BaseEntity',
+    __base__=BaseModel,
+    __doc__="Base class for all entities with universal properties",
+    tags=(Optional[List[str]], Field(None, description="Topic keywords, classification labels, or categorical tags used for organizing and filtering content within the knowledge base"))
+)
+
+
+def _model_to_struct(model: Type[BaseModel]) -> Type:
+    """Build a msgspec Struct with the same fields, annotations and defaults as model"""
+    struct_fields = []
+    for name, info in model.model_fields.items():
+        if info.is_required():
+            struct_fields.append((name, info.annotation))
+        else:
+            struct_fields.append((name, info.annotation, info.default))
+    return msgspec.defstruct(model.__name__, struct_fields, kw_only=True)
+
+
+def _schema_key(*parts: Any) -> bytes:
+    """Stable digest of JSON-compatible schema fragments"""
+    if orjson is not None:
+        payload = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(parts, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _cached_model(key: bytes, build) -> Type:
+    """Return the cached model for key, building and storing it on a miss"""
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is not None:
+            _MODEL_CACHE.move_to_end(key)
+            return model
+    model = build()
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.setdefault(key, model)
+        _MODEL_CACHE.move_to_end(key)
+        while len(_MODEL_CACHE) > _MODEL_CACHE_MAXSIZE:
+            _MODEL_CACHE.popitem(last=False)
+    return model
+
+
+@dataclass(slots=True)
+class EdgeMapping:
+    """One edgeTypeMap row: edge types allowed between a source and target entity"""
+    source_entity: Optional[str]
+    target_entity: Optional[str]
+    allowed_edges: List[str]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
 
 class DynamicModelLoader:
     """Dynamically generates Pydantic models from enhanced schema data.
@@ -24,6 +254,8 @@ class DynamicModelLoader:
         # Prefer new plugin id 'megamem-mcp' but keep backward-compatible probe for the old id.
         # If an explicit environment variable OBSIDIAN_PLUGIN_DATA_PATH is provided, use it.
         env_path = os.environ.get('OBSIDIAN_PLUGIN_DATA_PATH')
+        # stat of data.json taken while probing, reused by the first load_models call
+        self._data_json_stat: Optional[os.stat_result] = None
         if env_path:
             self.data_json_path = Path(env_path)
         else:
@@ -34,9 +266,10 @@ class DynamicModelLoader:
             fallback = self.vault_path / ".obsidian" / \
                 "plugins" / "obsidian-graphiti-mcp" / "data.json"
             # pick existing one if available, prefer primary
-            if primary.exists():
+            try:
+                self._data_json_stat = primary.stat()
                 self.data_json_path = primary
-            else:
+            except OSError:
                 self.data_json_path = fallback
         # Derive ontology.json path — same directory as data.json
         self.ontology_json_path = self.data_json_path.parent / 'ontology.json'
@@ -44,9 +277,44 @@ class DynamicModelLoader:
         self.edge_types: Dict[str, Type] = {}
         self.entity_type_definitions: Dict[str, Any] = {}
         self.edge_type_definitions: Dict[str, Any] = {}
-        self.edge_type_map: List[Dict[str, Any]] = []
+        self.edge_type_map: List[EdgeMapping] = []
+        # Entity and edge types merged once per load for get_all_types/create_model_instance
+        self._all_types: Dict[str, Type] = {}
+        # msgspec Struct mirrors, only populated when MEGAMEM_USE_MSGSPEC=1
+        self.entity_structs: Dict[str, Type] = {}
+        self.edge_structs: Dict[str, Type] = {}
+        self._graphiti_edge_type_map: Dict[tuple, List[str]] = {}
         self.loaded = False
+        # Ontology source and its mtime as of the last successful load
+        self._loaded_source: Optional[Path] = None
+        self._last_mtime_ns: Optional[int] = None
+        self._load_lock = threading.Lock()
         self.logger = logging.getLogger('graphiti_bridge.models')
+        self._refresh_accessors()
+
+    def _refresh_accessors(self) -> None:
+        """Snapshot what the get_* accessors return so each call is a single dict lookup"""
+        self._accessor_cache: Dict[str, Any] = {
+            'entity_types': self.entity_types,
+            'edge_types': self.edge_types,
+            'entity_type_definitions': self.entity_type_definitions,
+            'edge_type_definitions': self.edge_type_definitions,
+            'edge_type_map': [mapping.as_dict() for mapping in self.edge_type_map],
+            'graphiti_edge_type_map': self._graphiti_edge_type_map,
+        }
+
+    def _accessor(self, key: str) -> Any:
+        """Return a cached accessor value, loading models on first use"""
+        self._ensure_loaded()
+        return self._accessor_cache[key]
+
+    def _ensure_loaded(self) -> None:
+        """Load models on first use; concurrent first callers share a single load"""
+        if self.loaded:
+            return
+        with self._load_lock:
+            if not self.loaded:
+                self.load_models()
 
     def load_models(self) -> bool:
         """
@@ -56,21 +324,34 @@ class DynamicModelLoader:
             True if models were loaded successfully, False otherwise
         """
         try:
-            # Check if data.json exists
-            if not self.data_json_path.exists():
-                self.logger.error(
-                    f"Data.json not found: {self.data_json_path}")
-                return False
+            # Check if data.json exists (reusing the probe from __init__ on the first load)
+            data_stat, self._data_json_stat = self._data_json_stat, None
+            if data_stat is None:
+                try:
+                    data_stat = self.data_json_path.stat()
+                except OSError:
+                    self.logger.error(
+                        f"Data.json not found: {self.data_json_path}")
+                    return False
+
+            # Skip the parse and model generation when the ontology source is unchanged
+            try:
+                source_path = self.ontology_json_path
+                source_stat = self.ontology_json_path.stat()
+            except OSError:
+                source_path = self.data_json_path
+                source_stat = data_stat
+            mtime_ns = source_stat.st_mtime_ns
+            if self.loaded and source_path == self._loaded_source and mtime_ns == self._last_mtime_ns:
+                return True
 
             # Load ontology data — prefer ontology.json, fall back to data.json
-            if self.ontology_json_path.exists():
-                with open(self.ontology_json_path, 'r', encoding='utf-8') as f:
-                    ontology_data = json.load(f)
+            if source_path == self.ontology_json_path:
+                ontology_data = _load_ontology(self.ontology_json_path, source_stat.st_size)
                 self.logger.info(f"Loaded ontology from ontology.json: {self.ontology_json_path}")
             else:
                 # Backward compat: ontology still in data.json (pre-migration install)
-                with open(self.data_json_path, 'r', encoding='utf-8') as f:
-                    ontology_data = json.load(f)
+                ontology_data = _load_ontology(self.data_json_path, source_stat.st_size)
                 self.logger.info("ontology.json not found, reading ontology from data.json (pre-migration)")
 
             # Extract schema sections
@@ -95,13 +376,24 @@ class DynamicModelLoader:
             self.edge_types = self._generate_edge_models(edge_types_data)
             self.edge_type_definitions = self._create_edge_type_definitions(
                 edge_types_data)
+            self._all_types = {**self.entity_types, **self.edge_types}
+            if _USE_MSGSPEC:
+                self.entity_structs = self._generate_structs(self.entity_types)
+                self.edge_structs = self._generate_structs(self.edge_types)
 
             # Process edge type mappings
             self.edge_type_map = self._process_edge_type_map(
                 edge_type_map_data)
+            self._graphiti_edge_type_map = {
+                (m.source_entity, m.target_entity): m.allowed_edges
+                for m in self.edge_type_map
+            }
 
             self.logger.info(
                 f"Generated {len(self.entity_types)} entity types and {len(self.edge_types)} edge types")
+            self._refresh_accessors()
+            self._loaded_source = source_path
+            self._last_mtime_ns = mtime_ns
             self.loaded = True
             return True
 
@@ -114,24 +406,10 @@ class DynamicModelLoader:
                                 property_descriptions: Dict[str, Any],
                                 property_selections: Dict[str, Any]) -> Dict[str, Type]:
         """Generate Pydantic models for entity types using ontology property mappings and selections"""
-        models = {}
-
-        # First create BaseEntity with universal properties
-        base_entity_fields: Dict[str, Any] = {
-            'tags': (Optional[List[str]], Field(None, description="Topic keywords, classification labels, or categorical tags used for organizing and filtering content within the knowledge base"))
-        }
+        # BaseEntity with universal properties is shared by every loader
+        BaseEntity = _BASE_ENTITY
 
-        BaseEntity = create_model(
-            'BaseEntity',
-            __base__=BaseModel,
-            __doc__="Base class for all entities with universal properties",
-            **base_entity_fields
-        )
-
-        # Add BaseEntity to models dictionary
-        models['BaseEntity'] = BaseEntity
-
-        for entity_name, entity_info in entity_descriptions.items():
+        def build(entity_name, entity_info):
             try:
                 # Get enabled properties for this entity
                 entity_selections = property_selections.get(entity_name, {})
@@ -149,32 +427,33 @@ class DynamicModelLoader:
                         entity_name, enabled_properties, property_descriptions)
 
                 # Create the model inheriting from BaseEntity
-                # Extract fields safely for create_model
-                safe_fields = {}
-                for field_name, field_def in fields.items():
-                    if isinstance(field_def, tuple) and len(field_def) == 2:
-                        safe_fields[field_name] = field_def
-                    else:
-                        # Fallback for unexpected field format
-                        safe_fields[field_name] = (Optional[str], Field(
-                            None, description=f"Field {field_name}"))
-
-                model = create_model(
+                # Both field producers above always return (type, FieldInfo) pairs
+                if __debug__:
+                    assert all(isinstance(field_def, tuple) and len(field_def) == 2
+                               for field_def in fields.values()), f"Malformed fields for {entity_name}"
+
+                key = _schema_key('entity', entity_name, entity_info,
+                                  property_descriptions.get(entity_name, {}), entity_selections)
+                model = _cached_model(key, lambda: create_model(
                     entity_name,
                     __base__=BaseEntity,
                     __doc__=entity_info.get(
                         'description', self._get_standard_entity_description(entity_name)),
-                    **safe_fields
-                )
+                    **fields
+                ))
 
-                models[entity_name] = model
+                return model
 
             except Exception as e:
                 self.logger.error(
                     f"Failed to create model for entity {entity_name}: {e}")
-                continue
+                return None
 
-        return models
+        entity_models = {'BaseEntity': BaseEntity}
+        for entity_name, model in self._build_models(build, entity_descriptions):
+            if model is not None:
+                entity_models[entity_name] = model
+        return entity_models
 
     def _get_entity_fields_from_data(self, entity_name: str, enabled_properties: List[str],
                                      property_descriptions: Dict[str, Any]) -> Dict[str, tuple]:
@@ -185,150 +464,65 @@ class DynamicModelLoader:
         entity_property_descriptions = property_descriptions.get(
             entity_name, {})
 
-        for property_name in enabled_properties:
-            try:
+        # data.json is user-edited: entries are validated up front so a malformed one
+        # costs only that property; the outer guard covers a malformed entity section
+        property_name = None
+        try:
+            for property_name in enabled_properties:
                 # Use the snake_case property name directly (as stored in data.json)
                 # This matches Graphiti's requirement for snake_case attributes
 
-                # Get property description
                 prop_info = entity_property_descriptions.get(property_name, {})
-                description = prop_info.get(
-                    'description', f"Property {property_name} for {entity_name} entities")
+                if not isinstance(prop_info, dict):
+                    self.logger.error(
+                        f"Error processing property {property_name} for {entity_name}: "
+                        f"expected an object, got {type(prop_info).__name__}")
+                    continue
 
                 # Get field type
                 field_type = prop_info.get('fieldType', 'str')
+                if not isinstance(field_type, str):
+                    self.logger.error(
+                        f"Error processing property {property_name} for {entity_name}: "
+                        f"invalid fieldType {field_type!r}")
+                    continue
                 python_type = self._get_python_type(field_type)
 
+                # Get property description
+                description = _intern_text(prop_info.get(
+                    'description', f"Property {property_name} for {entity_name} entities"))
+
                 # Use snake_case name for the field (as required by Graphiti)
                 fields[property_name] = (
-                    Optional[python_type], Field(None, description=description))
+                    _OPTIONAL_TYPES[python_type], Field(None, description=description))
 
-            except Exception as e:
-                self.logger.error(
-                    f"Error processing property {property_name} for {entity_name}: {e}")
-                continue
+        except Exception as e:
+            self.logger.error(
+                f"Error processing property {property_name} for {entity_name}: {e}")
 
         return fields
 
     def _get_standard_entity_fields(self, entity_name: str) -> Dict[str, tuple]:
         """Get standard field definitions for each entity type to match reference format"""
-
-        if entity_name == "Person":
-            return {
-                'givenName': (Optional[str], Field(None, description="Given name or first name of the person as commonly used in introductions and personal identification")),
-                'familyName': (Optional[str], Field(None, description="Family name, surname, or last name of the person used for formal identification and family lineage")),
-                'c_name': (Optional[str], Field(None, description="Complete legal name including all given names, middle names, and family names as appears on official documents")),
-                'aliases': (Optional[List[str]], Field(None, description="Alternative names, nicknames, professional names, or pseudonyms by which the person is also known")),
-                'identity_type': (Optional[str], Field(None, description="Classification of person's legal and social identity status (natural_person, national_identity, pseudonym)")),
-                'birthDate': (Optional[datetime], Field(None, description="Date when the person was born in YYYY-MM-DD format for biographical and age calculation purposes")),
-                'address': (Optional[str], Field(None, description="Physical address, city, state, or geographic location where the person currently resides or is primarily based")),
-                'email': (Optional[str], Field(None, description="Primary email address used for professional or personal communication and contact purposes")),
-                'worksFor': (Optional[str], Field(None, description="Organization, company, or institution where the person is currently employed or holds a primary professional role")),
-                'jobTitle': (Optional[str], Field(None, description="Current professional role, position, or title that describes the person's responsibilities and level within an organization")),
-                'url': (Optional[str], Field(None, description="Personal website, professional profile, or primary online presence URL that represents the person")),
-                'needs': (Optional[str], Field(None, description="Specific resources, skills, connections, or support that the person requires to achieve their goals or be successful")),
-                'offers': (Optional[str], Field(None, description="Skills, services, knowledge, resources, or value that the person can provide to others or contribute to projects")),
-                'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs that identify the same person on other platforms, databases, or knowledge systems for entity linking"))
-            }
-
-        elif entity_name == "Organization":
-            return {
-                'c_name': (Optional[str], Field(None, description="Complete legal name of the organization as registered with government authorities or incorporation documents")),
-                'aliases': (Optional[List[str]], Field(None, description="Alternative names, trade names, brand names, acronyms, or abbreviations by which the organization is commonly known")),
-                'org_type': (Optional[str], Field(None, description="Legal structure and registration type of the organization (Unregistered, DAO, PMA, LLC, Inc, Partnership, 501c3, Government, etc.)")),
-                'foundingDate': (Optional[datetime], Field(None, description="Date when the organization was officially established, incorporated, or founded in YYYY-MM-DD format")),
-                'address': (Optional[str], Field(None, description="Physical headquarters address, primary business location, or registered office address of the organization")),
-                'needs': (Optional[str], Field(None, description="Resources, partnerships, talent, funding, or capabilities that the organization requires to achieve its mission and goals")),
-                'offers': (Optional[str], Field(None, description="Products, services, expertise, resources, or value propositions that the organization provides to customers or stakeholders")),
-                'url': (Optional[str], Field(None, description="Official website, primary web presence, or main digital platform representing the organization")),
-                'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs that identify the same organization on other platforms, databases, or knowledge systems for entity linking"))
-            }
-
-        elif entity_name == "Technology":
-            return {
-                'c_name': (Optional[str], Field(None, description="Complete official name of the software, technology, framework, or programming language as recognized by its creators")),
-                'aliases': (Optional[List[str]], Field(None, description="Alternative names, abbreviated forms, version names, or common references used by developers and users")),
-                'category': (Optional[str], Field(None, description="Primary classification of the technology type (framework, programming language, AI model, database, API, library, platform, etc.)")),
-                'opensource': (Optional[bool], Field(None, description="Whether the technology is open source software with publicly available source code and an open source license")),
-                'url': (Optional[str], Field(None, description="Official documentation website, main project page, or primary resource URL for the technology")),
-                'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs that identify the same technology on other platforms, repositories, or knowledge systems for entity linking"))
-            }
-
-        elif entity_name == "Product":
-            return {
-                'c_name': (Optional[str], Field(None, description="Complete official name of the product or service as marketed and recognized by customers and the industry")),
-                'aliases': (Optional[List[str]], Field(None, description="Alternative product names, brand variations, version names, or marketing names used across different markets or time periods")),
-                'offering_type': (Optional[str], Field(None, description="Primary business model and delivery method of the offering (product, service, platform, SaaS, API, subscription, etc.)")),
-                'category': (Optional[str], Field(None, description="Market segment, industry classification, or functional category that best describes the product's purpose and target market")),
-                'url': (Optional[str], Field(None, description="Official product page, service portal, or primary marketing website where customers can learn about or access the offering")),
-                'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs that identify the same product on other platforms, marketplaces, or knowledge systems for entity linking"))
-            }
-
-        elif entity_name == "Project":
-            return {
-                'c_name': (Optional[str], Field(None, description="Complete official name of the project, initiative, or undertaking as recognized by stakeholders and participants")),
-                'aliases': (Optional[List[str]], Field(None, description="Alternative project names, codenames, working titles, or informal references used during different phases of development")),
-                'project_type': (Optional[str], Field(None, description="Classification of the project's primary purpose and methodology (research, development, initiative, startup, campaign, collaboration, etc.)")),
-                'status': (Optional[str], Field(None, description="Current phase or state of the project lifecycle (planning, active, completed, paused, cancelled, on-hold)")),
-                'needs': (Optional[str], Field(None, description="Resources, expertise, partnerships, funding, or support that the project requires to achieve its objectives and deliverables")),
-                'offers': (Optional[str], Field(None, description="Outcomes, deliverables, knowledge, tools, or value that the project will produce or contribute to its field or community")),
-                'url': (Optional[str], Field(None, description="Official project page, repository, documentation site, or primary web presence where information about the project is maintained")),
-                'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs that identify the same project on other platforms, repositories, or knowledge systems for entity linking"))
-            }
-
-        elif entity_name == "WebPage":
-            return {
-                'c_name': (Optional[str], Field(None, description="Complete title or headline of the web page as it appears in the browser title bar or page header")),
-                'aliases': (Optional[List[str]], Field(None, description="Alternative titles, SEO variations, shortened versions, or social media titles used for the same content")),
-                'url': (str, Field(description="Complete web address or URL where the page can be accessed on the internet")),
-                'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs of archived versions, mirror sites, or equivalent content locations for the same web page"))
-            }
-
-        elif entity_name == "Note":
-            return {
-                'note_type': (Optional[str], Field(None, description="Classification of the note's purpose and content structure (idea, analysis, reflection, meeting_notes, research, synthesis, etc.)")),
-                'author': (Optional[str], Field(None, description="Person who created, wrote, or is primarily responsible for the content and insights contained in the note")),
-                'created_date': (Optional[datetime], Field(None, description="Date when the note was originally created or when the ideas were first captured in YYYY-MM-DD format"))
-            }
-
-        elif entity_name == "Article":
-            return {
-                'c_name': (Optional[str], Field(None, description="Complete title or headline of the published article as it appears in the final publication")),
-                'aliases': (Optional[List[str]], Field(None, description="Alternative titles, working titles, social media versions, or translated titles used for the same article")),
-                'article_type': (Optional[str], Field(None, description="Genre or format classification of the published content (essay, blog_post, analysis, tutorial, whitepaper, research_paper, etc.)")),
-                'author': (Optional[str], Field(None, description="Person or organization who wrote, created, or is credited as the primary author of the published article")),
-                'published_date': (Optional[datetime], Field(None, description="Date when the article was officially published or made publicly available in YYYY-MM-DD format")),
-                'url': (Optional[str], Field(None, description="Web address where the published article can be read or accessed online")),
-                'sameAs': (Optional[List[str]], Field(None, description="URIs or URLs of archived versions, republished versions, or equivalent content locations for the same article"))
-            }
-
-        else:
-            # Default fields for unknown entity types
-            return {
-                'c_name': (Optional[str], Field(None, description=f"Complete name of the {entity_name}")),
-                'aliases': (Optional[List[str]], Field(None, description=f"Alternative names for the {entity_name}")),
-                'sameAs': (Optional[List[str]], Field(None, description=f"URIs that identify the same {entity_name} on other platforms"))
-            }
+        fields = _STANDARD_ENTITY_FIELDS.get(entity_name)
+        if fields is not None:
+            return fields
+
+        # Default fields for unknown entity types
+        return {
+            'c_name': (Optional[str], Field(None, description=f"Complete name of the {entity_name}")),
+            'aliases': (Optional[List[str]], Field(None, description=f"Alternative names for the {entity_name}")),
+            'sameAs': (Optional[List[str]], Field(None, description=f"URIs that identify the same {entity_name} on other platforms"))
+        }
 
     def _get_standard_entity_description(self, entity_name: str) -> str:
         """Get standard description for each entity type"""
-        descriptions = {
-            "Person": "A human actor (natural person or national identity)",
-            "Organization": "An organization, company, or institution",
-            "Technology": "Technology, framework, programming language, or software",
-            "Product": "A product, service, or offering",
-            "Project": "A project, initiative, or undertaking",
-            "WebPage": "Web page, article, or documentation",
-            "Note": "Personal notes and ideas",
-            "Article": "Published articles and content"
-        }
-        return descriptions.get(entity_name, f"{entity_name} entity")
+        return _STANDARD_ENTITY_DESCRIPTIONS.get(entity_name, f"{entity_name} entity")
 
     def _generate_edge_models(self, edge_types_data: Dict[str, Any]) -> Dict[str, Type]:
         """Generate Pydantic models for edge types"""
-        models = {}
 
-        for edge_name, edge_info in edge_types_data.items():
+        def build(edge_name, edge_info):
             try:
                 # Build field definitions
                 fields = {}
@@ -341,192 +535,192 @@ class DynamicModelLoader:
                     field_type = self._get_python_type(
                         prop_info.get('fieldType', 'str'))
                     is_required = prop_info.get('required', False)
-                    description = prop_info.get(
-                        'description', f"Property {prop_name} for {edge_name}")
+                    description = _intern_text(prop_info.get(
+                        'description', f"Property {prop_name} for {edge_name}"))
 
                     if is_required:
                         fields[prop_name] = (
                             field_type, Field(description=description))
                     else:
-                        fields[prop_name] = (Optional[field_type], Field(
+                        fields[prop_name] = (_OPTIONAL_TYPES[field_type], Field(
                             default=None, description=description))
 
-                # Create the model
-                model = create_model(
+                # Create the model (reused from the cache when the edge schema is unchanged)
+                model = _cached_model(_schema_key('edge', edge_name, edge_info), lambda: create_model(
                     edge_name,
                     __base__=BaseModel,
                     __doc__=edge_info.get(
                         'description', f"{edge_name} edge type"),
                     **fields
-                )
+                ))
 
-                models[edge_name] = model
+                return model
 
             except Exception as e:
                 self.logger.error(
                     f"Failed to create model for edge {edge_name}: {e}")
-                continue
+                return None
+
+        return {edge_name: model
+                for edge_name, model in self._build_models(build, edge_types_data)
+                if model is not None}
 
-        return models
+    def _generate_structs(self, models: Dict[str, Type]) -> Dict[str, Type]:
+        """Mirror generated pydantic models as msgspec Structs (MEGAMEM_USE_MSGSPEC=1)"""
+        structs = {}
+        for name, model in models.items():
+            try:
+                structs[name] = _model_to_struct(model)
+            except Exception as e:
+                self.logger.error(f"Failed to create msgspec struct for {name}: {e}")
+        return structs
+
+    def _build_models(self, build, source: Dict[str, Any]) -> List[tuple]:
+        """Run build(name, info) for every type in source, returning (name, model) pairs in
+        source order. Large ontologies use a thread pool so pydantic schema builds overlap."""
+        items = list(source.items())
+        if len(items) < _PARALLEL_MODEL_THRESHOLD:
+            return [(name, build(name, info)) for name, info in items]
+        with ThreadPoolExecutor(max_workers=min(8, len(items))) as executor:
+            results = executor.map(lambda item: build(*item), items)
+            return [(name, model) for (name, _), model in zip(items, results)]
 
     def _create_entity_type_definitions(self, entity_descriptions: Dict[str, Any],
                                         property_descriptions: Dict[str, Any]) -> Dict[str, Any]:
         """Create entity type definitions for Graphiti Custom Entities API"""
-        definitions = {}
-
-        for entity_name, entity_info in entity_descriptions.items():
-            entity_props = property_descriptions.get(entity_name, {})
-
-            # Build property definitions
-            properties = {}
-            for prop_name, prop_info in entity_props.items():
-                properties[prop_name] = {
-                    'type': prop_info.get('fieldType', 'str'),
-                    'required': prop_info.get('required', False),
-                    'description': prop_info.get('description', f"Property {prop_name}")
-                }
-
-            definitions[entity_name] = {
-                'description': entity_info.get('description', f"{entity_name} entity"),
-                'properties': properties
-            }
-
-        return definitions
+        return self._build_type_definitions(entity_descriptions, "entity", property_descriptions)
 
     def _create_edge_type_definitions(self, edge_types_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create edge type definitions for Graphiti Custom Entities API"""
+        return self._build_type_definitions(edge_types_data, "edge type")
+
+    def _build_type_definitions(self, source: Dict[str, Any], kind: str,
+                                prop_source: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build {name: {description, properties}} definitions for entity or edge types.
+
+        Properties come from prop_source[name] when given (entities keep them in
+        propertyDescriptions), otherwise from the type's own 'properties' (edges).
+        """
         definitions = {}
 
-        for edge_name, edge_info in edge_types_data.items():
-            edge_props = edge_info.get('properties', {})
+        for type_name, type_info in source.items():
+            if prop_source is not None:
+                type_props = prop_source.get(type_name, {})
+            else:
+                type_props = type_info.get('properties', {})
 
             # Build property definitions
             properties = {}
-            for prop_name, prop_info in edge_props.items():
+            for prop_name, prop_info in type_props.items():
                 properties[prop_name] = {
                     'type': prop_info.get('fieldType', 'str'),
                     'required': prop_info.get('required', False),
                     'description': prop_info.get('description', f"Property {prop_name}")
                 }
 
-            definitions[edge_name] = {
-                'description': edge_info.get('description', f"{edge_name} edge type"),
+            definitions[type_name] = {
+                'description': type_info.get('description', f"{type_name} {kind}"),
                 'properties': properties
             }
 
         return definitions
 
-    def _process_edge_type_map(self, edge_type_map_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _process_edge_type_map(self, edge_type_map_data: List[Dict[str, Any]]) -> List[EdgeMapping]:
         """Process edge type mappings for internal storage"""
-        processed_map = []
-
-        for mapping in edge_type_map_data:
-            processed_map.append({
-                'source_entity': mapping.get('sourceEntity'),
-                'target_entity': mapping.get('targetEntity'),
-                'allowed_edges': mapping.get('allowedEdges', [])
-            })
-
-        return processed_map
+        return [
+            EdgeMapping(
+                source_entity=mapping.get('sourceEntity'),
+                target_entity=mapping.get('targetEntity'),
+                allowed_edges=mapping.get('allowedEdges', [])
+            )
+            for mapping in edge_type_map_data
+        ]
 
     def _convert_edge_type_map_for_graphiti(self) -> Dict[tuple, List[str]]:
         """Convert edge type map to Graphiti format: {(source, target): [edge_types]}"""
-        graphiti_map = {}
-
-        for mapping in self.edge_type_map:
-            key = (mapping['source_entity'], mapping['target_entity'])
-            graphiti_map[key] = mapping['allowed_edges']
-
-        return graphiti_map
+        # Built once in load_models
+        return self._graphiti_edge_type_map
 
     def _get_python_type(self, field_type_str: str) -> Type:
         """Convert field type string to Python type"""
-        type_mapping = {
-            'str': str,
-            'int': int,
-            'float': float,
-            'bool': bool,
-            'datetime': datetime,
-            'List[str]': List[str],
-            'List[int]': List[int],
-            'List[float]': List[float]
-        }
-
-        return type_mapping.get(field_type_str, str)
+        return _TYPE_MAPPING.get(field_type_str, str)
 
     def get_entity_types(self) -> Dict[str, Type]:
         """Get dictionary of loaded entity types"""
-        if not self.loaded:
-            self.load_models()
-        return self.entity_types
+        return self._accessor('entity_types')
 
     def get_edge_types(self) -> Dict[str, Type]:
         """Get dictionary of loaded edge types"""
-        if not self.loaded:
-            self.load_models()
-        return self.edge_types
+        return self._accessor('edge_types')
 
     def get_entity_type_definitions(self) -> Dict[str, Any]:
         """Get entity type definitions for Graphiti Custom Entities API"""
-        if not self.loaded:
-            self.load_models()
-        return self.entity_type_definitions
+        return self._accessor('entity_type_definitions')
 
     def get_edge_type_definitions(self) -> Dict[str, Any]:
         """Get edge type definitions for Graphiti Custom Entities API"""
-        if not self.loaded:
-            self.load_models()
-        return self.edge_type_definitions
+        return self._accessor('edge_type_definitions')
 
     def get_edge_type_map(self) -> List[Dict[str, Any]]:
-        """Get edge type mappings for internal use"""
-        if not self.loaded:
-            self.load_models()
-        return self.edge_type_map
+        """Get edge type mappings for internal use (as dicts, for backward compatibility)"""
+        return self._accessor('edge_type_map')
 
     def get_graphiti_entity_types(self) -> Dict[str, Type]:
         """Get entity types as dict {name: class} for Graphiti"""
-        if not self.loaded:
-            self.load_models()
-        return self.entity_types
+        return self._accessor('entity_types')
 
     def get_graphiti_edge_types(self) -> Dict[str, Type]:
         """Get edge types as dict {name: class} for Graphiti"""
-        if not self.loaded:
-            self.load_models()
-        return self.edge_types
+        return self._accessor('edge_types')
 
     def get_graphiti_edge_type_map(self) -> Dict[tuple, List[str]]:
         """Get edge type map in Graphiti format: {(source, target): [edge_types]}"""
-        if not self.loaded:
-            self.load_models()
-        return self._convert_edge_type_map_for_graphiti()
+        return self._accessor('graphiti_edge_type_map')
+
+    def get_entity_structs(self) -> Dict[str, Type]:
+        """Get msgspec Struct versions of the entity types for fast decode/validation.
+
+        Empty unless MEGAMEM_USE_MSGSPEC=1 and msgspec is installed. Graphiti itself
+        still needs the pydantic models from get_graphiti_entity_types.
+        """
+        self._ensure_loaded()
+        return self.entity_structs
+
+    def get_edge_structs(self) -> Dict[str, Type]:
+        """Get msgspec Struct versions of the edge types (see get_entity_structs)"""
+        self._ensure_loaded()
+        return self.edge_structs
 
     def get_all_types(self) -> Dict[str, Type]:
         """Get all loaded types (entities and edges combined)"""
-        all_types = {}
-        all_types.update(self.get_entity_types())
-        all_types.update(self.get_edge_types())
-        return all_types
+        self._ensure_loaded()
+        return self._all_types
 
-    def create_model_instance(self, type_name: str, data: Dict[str, Any]) -> Optional[Any]:
+    def create_model_instance(self, type_name: str, data: Dict[str, Any],
+                              validate: bool = True) -> Optional[Any]:
         """
         Create an instance of a loaded model with provided data
 
         Args:
             type_name: Name of the model type
             data: Dictionary of field values
+            validate: Run pydantic validation (default). Pass False only for data that
+                is already known to be valid (e.g. read back from Graphiti): it uses
+                model_construct, which is much faster but skips type coercion and
+                validators, so bad data is stored as-is
 
         Returns:
             Model instance or None if creation failed
         """
         try:
-            all_types = self.get_all_types()
-            if type_name not in all_types:
+            self._ensure_loaded()
+            model_class = self._all_types.get(type_name)
+            if model_class is None:
                 self.logger.error(f"Unknown model type: {type_name}")
                 return None
 
-            model_class = all_types[type_name]
+            if not validate:
+                return model_class.model_construct(**data)
             return model_class(**data)
 
         except Exception as e:
@@ -558,26 +752,38 @@ def load_models_from_path(models_path: str) -> Optional[DynamicModelLoader]:
 # Global model loader instance (initialized when needed)
 _global_loader: Optional[DynamicModelLoader] = None
 _loader_lock = threading.Lock()
+# Set once _global_loader holds a successfully loaded loader
+_loader_ready = threading.Event()
+
+# Loaded loaders per vault path for get_entity_types_with_config
+_vault_loader_cache: Dict[str, DynamicModelLoader] = {}
+_vault_loader_lock = threading.Lock()
+
+# config.get_vault_path, bound on the first cold bootstrap so later ones skip the import machinery
+_get_vault_path = None
 
 
 def ensure_loader_initialized() -> bool:
     """Ensure global loader is initialized and loaded. Returns True if successful."""
-    global _global_loader
+    global _global_loader, _get_vault_path
 
     # Quick check without lock for performance
-    if _global_loader is not None and _global_loader.loaded:
+    if _loader_ready.is_set():
         return True
 
     # Thread-safe initialization
     with _loader_lock:
         # Double-check pattern
-        if _global_loader is not None and _global_loader.loaded:
+        loader = _global_loader
+        if loader is not None and loader.loaded:
+            _loader_ready.set()
             return True
 
         logging.info("Initializing global loader...")
         try:
-            from .config import get_vault_path
-            vault_path = get_vault_path()
+            if _get_vault_path is None:
+                from .config import get_vault_path as _get_vault_path
+            vault_path = _get_vault_path()
 
             if not vault_path:
                 logging.warning(
@@ -588,6 +794,7 @@ def ensure_loader_initialized() -> bool:
             if _global_loader.load_models():
                 logging.info(
                     f"Global loader initialized with entity types: {list(_global_loader.entity_types.keys())}")
+                _loader_ready.set()
                 return True
             else:
                 logging.warning("Failed to load models in global loader")
@@ -605,64 +812,66 @@ def get_global_loader() -> Optional[DynamicModelLoader]:
 def initialize_global_loader(vault_path: str) -> bool:
     """Initialize the global model loader with vault path"""
     global _global_loader
+    _loader_ready.clear()
     _global_loader = DynamicModelLoader(vault_path)
-    return _global_loader.load_models()
+    if _global_loader.load_models():
+        _loader_ready.set()
+        return True
+    return False
+
+
+def _global_accessor(key: str, default: Any) -> Any:
+    """Cached accessor value from the global loader, or default when there is none"""
+    loader = _global_loader
+    if loader is None:
+        return default
+    return loader._accessor(key)
 
 
 def get_node_types() -> Dict[str, Type]:
     """Get entity types from global loader (backward compatibility)"""
-    if _global_loader:
-        return _global_loader.get_entity_types()
-    return {}
+    return _global_accessor('entity_types', {})
 
 
 def get_edge_types() -> Dict[str, Type]:
     """Get edge types from global loader (backward compatibility)"""
-    if _global_loader:
-        return _global_loader.get_edge_types()
-    return {}
+    return _global_accessor('edge_types', {})
 
 
 def get_entity_type_definitions() -> Dict[str, Any]:
     """Get entity type definitions for Graphiti Custom Entities API"""
-    if _global_loader:
-        return _global_loader.get_entity_type_definitions()
-    return {}
+    return _global_accessor('entity_type_definitions', {})
 
 
 def get_edge_type_definitions() -> Dict[str, Any]:
     """Get edge type definitions for Graphiti Custom Entities API"""
-    if _global_loader:
-        return _global_loader.get_edge_type_definitions()
-    return {}
+    return _global_accessor('edge_type_definitions', {})
 
 
 def get_edge_type_map() -> List[Dict[str, Any]]:
     """Get edge type mappings for internal use"""
-    if _global_loader:
-        return _global_loader.get_edge_type_map()
-    return []
+    return _global_accessor('edge_type_map', [])
 
 
 # New Graphiti-format functions
 def get_graphiti_entity_types() -> Dict[str, Type]:
     """Get entity types as dict {name: class} for Graphiti"""
     if ensure_loader_initialized():
-        return _global_loader.get_graphiti_entity_types()  # type: ignore
+        return _global_loader._accessor_cache['entity_types']  # type: ignore
     return {}
 
 
 def get_graphiti_edge_types() -> Dict[str, Type]:
     """Get edge types as dict {name: class} for Graphiti"""
     if ensure_loader_initialized():
-        return _global_loader.get_graphiti_edge_types()  # type: ignore
+        return _global_loader._accessor_cache['edge_types']  # type: ignore
     return {}
 
 
 def get_graphiti_edge_type_map() -> Dict[tuple, List[str]]:
     """Get edge type map in Graphiti format: {(source, target): [edge_types]}"""
     if ensure_loader_initialized():
-        return _global_loader.get_graphiti_edge_type_map()  # type: ignore
+        return _global_loader._accessor_cache['graphiti_edge_type_map']  # type: ignore
     return {}
 
 
@@ -681,6 +890,19 @@ def get_entity_types() -> List[str]:
     return ['Person', 'Organization', 'Technology', 'Product', 'Project', 'WebPage', 'Note', 'Article']
 
 
+@functools.lru_cache(maxsize=8)
+def _vault_path_from_config_path(config_path: str) -> str:
+    """Derive the vault root from an OBSIDIAN_CONFIG_PATH value (fixed for the process lifetime)"""
+    # Config is typically at: vault/.obsidian/plugins/<plugin-id>/data.json
+    # Previously this used 'obsidian-graphiti-mcp' — support both ids and derive vault path accordingly.
+    cfg_path = Path(config_path)
+    # If config_path points inside a plugin directory, climb up to vault root
+    # Example: vault/.obsidian/plugins/megamem-mcp/data.json -> vault root is 4 parents up
+    if 'plugins' in config_path:
+        return str(cfg_path.parent.parent.parent.parent)
+    return str(cfg_path)
+
+
 def get_entity_types_with_config(obsidian_config: Dict[str, Any]) -> Dict[str, Type]:
     """
     Get entity types from config-specific vault path for Graphiti custom ontology
@@ -697,9 +919,6 @@ def get_entity_types_with_config(obsidian_config: Dict[str, Any]) -> Dict[str, T
         return _global_loader.get_graphiti_entity_types()
 
     try:
-        import os
-        from pathlib import Path
-
         logging.info(
             f"get_entity_types called with config keys: {list(obsidian_config.keys())}")
 
@@ -718,15 +937,7 @@ def get_entity_types_with_config(obsidian_config: Dict[str, Any]) -> Dict[str, T
             config_path = os.environ.get('OBSIDIAN_CONFIG_PATH')
             logging.info(f"Config path from environment: {config_path}")
             if config_path:
-                # Config is typically at: vault/.obsidian/plugins/<plugin-id>/data.json
-                # Previously this used 'obsidian-graphiti-mcp' — support both ids and derive vault path accordingly.
-                cfg_path = Path(config_path)
-                # If config_path points inside a plugin directory, climb up to vault root
-                # Example: vault/.obsidian/plugins/megamem-mcp/data.json -> vault root is 4 parents up
-                if 'plugins' in str(cfg_path):
-                    vault_path = str(cfg_path.parent.parent.parent.parent)
-                else:
-                    vault_path = str(cfg_path)
+                vault_path = _vault_path_from_config_path(config_path)
                 logging.info(f"Derived vault path: {vault_path}")
             else:
                 # Fallback: use the global loader if available
@@ -741,12 +952,19 @@ def get_entity_types_with_config(obsidian_config: Dict[str, Any]) -> Dict[str, T
         logging.info(
             f"Attempting to load models from vault path: {vault_path}")
 
-        # Create a temporary loader for this config
-        temp_loader = DynamicModelLoader(vault_path)
-        if temp_loader.load_models():
+        # Reuse the loader built for this vault. load_models() on a cached loader is an
+        # mtime check that reloads only when the ontology changed on disk
+        with _vault_loader_lock:
+            temp_loader = _vault_loader_cache.get(vault_path) or DynamicModelLoader(vault_path)
+            loaded = temp_loader.load_models()
+            if loaded:
+                _vault_loader_cache[vault_path] = temp_loader
+
+        if loaded:
             # Initialize global loader for caching if not already set
             if _global_loader is None:
                 _global_loader = temp_loader
+                _loader_ready.set()
                 logging.info("Initialized global loader for caching")
 
             entity_types = temp_loader.get_graphiti_entity_types()
@@ -2,10 +2,14 @@
 OpenRouter-specific client that properly handles structured output.
 """
 
+import asyncio
+import functools
+import itertools
 import json
 import logging
 import re
 import typing
+import weakref
 
 import httpx
 from typing import ClassVar
@@ -20,20 +24,40 @@ from graphiti_core.llm_client.config import DEFAULT_MAX_TOKENS, LLMConfig, Model
 from graphiti_core.llm_client.errors import RateLimitError, RefusalError
 from graphiti_core.prompts.models import Message
 
+# Optional fast JSON parser for structured responses; falls back to stdlib json.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError (and keeps .doc), so the
+# HTML detection in the decode-error handler still applies.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 
 logger = logging.getLogger('graphiti_bridge.sync')
 
+# The instruction depends only on group_id, of which a sync run sees very few
+_language_instruction = functools.lru_cache(maxsize=128)(get_extraction_language_instruction)
+
 
 class InfrastructureError(Exception):
     """Raised when the service provider has infrastructure issues"""
     pass
 
 
+# Patterns used on HTML error pages and fenced model output
+_RE_ERROR_CODE = re.compile(r'Error (\d+)', re.IGNORECASE)
+_RE_WORKER_LIMIT = re.compile(r'Worker exceeded resource limits', re.IGNORECASE)
+_RE_FENCE_OPEN = re.compile(r'^```(?:json|JSON)?\s*\n?')
+_RE_FENCE_CLOSE = re.compile(r'\n?\s*```\s*$')
+
+
 def _parse_html_error(html_content: str) -> str:
     """Parse HTML error page to extract meaningful error information"""
     # Look for specific error patterns with priority order
-    error_code_match = re.search(r'Error (\d+)', html_content, re.IGNORECASE)
-    description_match = re.search(r'Worker exceeded resource limits', html_content, re.IGNORECASE)
+    error_code_match = _RE_ERROR_CODE.search(html_content)
+    description_match = _RE_WORKER_LIMIT.search(html_content)
     
     if error_code_match and description_match:
         return f"OpenRouter infrastructure error: Error {error_code_match.group(1)} - Worker exceeded resource limits"
@@ -45,12 +69,112 @@ def _parse_html_error(html_content: str) -> str:
         # Fallback to generic HTML error detection
         return "OpenRouter infrastructure error: HTML error page detected - Service temporarily unavailable"
 
-DEFAULT_MODEL = 'openai/gpt-4o-mini'
 
-# Global response counter for aggregated logging
-_global_response_count = 0
-_last_provider = None
-_last_model = None
+def _looks_like_html(text: str) -> bool:
+    """Cheap check for an HTML error page: only the first few characters are inspected"""
+    head = text[:64].lstrip()
+    if not head.startswith('<'):
+        return False
+    head = head[:9].lower()
+    return head.startswith('<!doctype') or head.startswith('<html')
+
+DEFAULT_MODEL = 'openai/gpt-4o-mini'
+DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
+
+# AsyncOpenAI clients shared per event loop and (api_key, base_url), so clients in the
+# same process reuse one httpx connection pool. Keyed by loop because pooled
+# connections cannot outlive the loop that opened them (e.g. repeated asyncio.run).
+_shared_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str | None, str], AsyncOpenAI]]" = weakref.WeakKeyDictionary()
+
+
+def _shared_async_openai(api_key: str | None, base_url: str) -> AsyncOpenAI:
+    """Return the AsyncOpenAI client for (api_key, base_url) on the running loop"""
+    def create() -> AsyncOpenAI:
+        return AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=httpx.Timeout(connect=10.0, read=90.0, write=10.0, pool=10.0)
+        )
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop yet to tie a shared pool to
+        return create()
+    clients = _shared_openai_clients.setdefault(loop, {})
+    client = clients.get((api_key, base_url))
+    if client is None:
+        client = clients[(api_key, base_url)] = create()
+    return client
+
+
+def _fix_schema_for_openrouter(schema):
+    """OpenRouter requires additionalProperties: false and a full required array on every object.
+    Walks the schema with an explicit stack rather than recursing per node."""
+    stack = [schema]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            if obj.get('type') == 'object':
+                # Nodes that already conform (e.g. extra='forbid' models with no
+                # defaulted fields) are left untouched; their children are still visited
+                if obj.get('additionalProperties') is not False:
+                    obj['additionalProperties'] = False
+                # Add required field with all property names if properties exist.
+                # required is a subset of the property names, so equal length means complete.
+                props = obj.get('properties')
+                if props and len(obj.get('required', ())) != len(props):
+                    obj['required'] = list(props)
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_openrouter_schema(response_model: type[BaseModel]) -> dict:
+    """JSON schema for response_model with OpenRouter's fixes applied, built once per class"""
+    schema = response_model.model_json_schema()
+    _fix_schema_for_openrouter(schema)
+    return schema
+
+
+class _ReadOnlyDict(dict):
+    """dict that rejects mutation, for payload pieces shared between requests.
+    Still a real dict, so JSON encoders and the SDK's request transforms accept it
+    (a MappingProxyType is not JSON serializable); copies are plain dicts."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f'{type(self).__name__} is read-only')
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+@functools.lru_cache(maxsize=None)
+def _openrouter_response_format(response_model: type[BaseModel]) -> dict:
+    """Strict json_schema response_format for response_model, built once per class.
+    Shared between requests, so the wrapper is read-only."""
+    return _ReadOnlyDict({
+        'type': 'json_schema',
+        'json_schema': _ReadOnlyDict({
+            'name': response_model.__name__,
+            'strict': True,
+            'schema': _build_openrouter_schema(response_model)
+        })
+    })
+
+
+# Message roles forwarded to the chat completions API; others are dropped
+_OPENAI_ROLES = frozenset(('user', 'system'))
+
+
+# Process-wide response counter for aggregated logging
+_response_counter = itertools.count(1)
 
 
 class OpenRouterClient(LLMClient):
@@ -77,44 +201,51 @@ class OpenRouterClient(LLMClient):
             config = LLMConfig()
 
         super().__init__(config, cache)
-        
+
+        # Resolved here rather than at import so it picks up setup_logging's bridge logger
+        self._logger = logging.getLogger('graphiti_bridge.sync')
+
+        # Model names are fixed once configured; resolve the fallbacks here instead of per request
+        self._resolved_main = getattr(self, 'model', None) or getattr(config, 'model', None) or DEFAULT_MODEL
+        self._resolved_small = getattr(self, 'small_model', None) or getattr(config, 'small_model', None)
+        if not self._resolved_small:
+            self._logger.info("No small_model configured for OpenRouter, using main model as fallback")
+            self._resolved_small = self._resolved_main
+
+        # id(message) -> content object produced by _clean_input, so retries resending the
+        # same Message objects skip re-cleaning them. Messages are pydantic models without
+        # weakref support, hence ids plus an identity check on the stored content.
+        self._cleaned_contents: dict[int, str] = {}
+
         # Store provider preferences
         self.preferred_providers = preferred_providers
         self.excluded_providers = excluded_providers
 
+        # CRITICAL: OpenRouter needs provider preferences for structured output.
+        # They are fixed for the client's lifetime, so build the extra_body once.
+        provider_config = {
+            'require_parameters': True
+        }
+        # Add preferred providers if specified
+        if preferred_providers:
+            provider_config['order'] = preferred_providers
+        # Add excluded providers if specified
+        if excluded_providers:
+            provider_config['ignore'] = excluded_providers
+        self._extra_body = {
+            'provider': provider_config
+        }
+
         if client is None:
-            self.client = AsyncOpenAI(
-                api_key=config.api_key,
-                base_url=config.base_url or "https://openrouter.ai/api/v1",
-                timeout=httpx.Timeout(connect=10.0, read=90.0, write=10.0, pool=10.0)
-            )
+            self.client = _shared_async_openai(config.api_key, config.base_url or DEFAULT_BASE_URL)
         else:
             self.client = client
 
     def _get_model_for_size(self, model_size: ModelSize) -> str:
-        """Get appropriate model based on size requirement"""
-        logger = logging.getLogger('graphiti_bridge.sync')
-        
+        """Get appropriate model based on size requirement (resolved in __init__)"""
         if model_size == ModelSize.small:
-            # Try to get small model from instance or config
-            small_model = getattr(self, 'small_model', None)
-            if not small_model and hasattr(self, 'config'):
-                small_model = getattr(self.config, 'small_model', None)
-            
-            if not small_model:
-                logger.info("No small_model configured for OpenRouter, using main model as fallback")
-                # Fallback to main model, then default
-                main_model = getattr(self, 'model', None)
-                if not main_model and hasattr(self, 'config'):
-                    main_model = getattr(self.config, 'model', None)
-                return main_model if main_model else DEFAULT_MODEL
-            return small_model
-        else:
-            # Use main model
-            main_model = getattr(self, 'model', None)
-            if not main_model and hasattr(self, 'config'):
-                main_model = getattr(self.config, 'model', None)
-            return main_model if main_model else DEFAULT_MODEL
+            return self._resolved_small
+        return self._resolved_main
 
     async def _generate_response(
         self,
@@ -124,16 +255,18 @@ class OpenRouterClient(LLMClient):
         model_size: ModelSize = ModelSize.medium,
         prompt_name: str | None = None,
     ) -> dict[str, typing.Any]:
-        logger = logging.getLogger('graphiti_bridge.sync')
-        
-        openai_messages: list[ChatCompletionMessageParam] = []
+        cleaned = self._cleaned_contents
+        if len(cleaned) > 4096:
+            cleaned.clear()
+        clean = self._clean_input
         for m in messages:
-            m.content = self._clean_input(m.content)
-            if m.role == 'user':
-                openai_messages.append({'role': 'user', 'content': m.content})
-            elif m.role == 'system':
-                openai_messages.append(
-                    {'role': 'system', 'content': m.content})
+            if cleaned.get(id(m)) is not m.content:
+                m.content = clean(m.content)
+                cleaned[id(m)] = m.content
+        openai_messages: list[ChatCompletionMessageParam] = [
+            {'role': m.role, 'content': m.content}
+            for m in messages if m.role in _OPENAI_ROLES
+        ]
 
         try:
             # Prepare request parameters
@@ -147,51 +280,13 @@ class OpenRouterClient(LLMClient):
             # For OpenRouter, we need different handling based on schema complexity
             if response_model is not None:
                 # Use json_schema format with provider preferences for structured output
-                schema = response_model.model_json_schema()
-
                 # CRITICAL: OpenRouter requires additionalProperties: false and required array for all objects
-                def fix_schema_for_openrouter(obj):
-                    if isinstance(obj, dict):
-                        if obj.get('type') == 'object':
-                            obj['additionalProperties'] = False
-                            # Add required field with all property names if properties exist
-                            if 'properties' in obj and obj['properties']:
-                                obj['required'] = list(
-                                    obj['properties'].keys())
-                        for value in obj.values():
-                            fix_schema_for_openrouter(value)
-                    elif isinstance(obj, list):
-                        for item in obj:
-                            fix_schema_for_openrouter(item)
-
-                fix_schema_for_openrouter(schema)
-
-                request_params['response_format'] = {
-                    'type': 'json_schema',
-                    'json_schema': {
-                        'name': response_model.__name__,
-                        'strict': True,
-                        'schema': schema
-                    }
-                }
-                # CRITICAL: OpenRouter needs provider preferences for structured output
-                provider_config = {
-                    'require_parameters': True
-                }
-                
-                # Add preferred providers if specified
-                if self.preferred_providers:
-                    provider_config['order'] = self.preferred_providers
-                    
-                # Add excluded providers if specified
-                if self.excluded_providers:
-                    provider_config['ignore'] = self.excluded_providers
-                    
-                request_params['extra_body'] = {
-                    'provider': provider_config
-                }
+                # (schema and wrapper are cached per response model class)
+                request_params['response_format'] = _openrouter_response_format(response_model)
+                # Provider preferences for structured output routing (built in __init__)
+                request_params['extra_body'] = self._extra_body
                 
-                logger.debug(f"[OPENROUTER-PARAMS] Model: {request_params['model']}, format: json_schema strict=True, require_parameters=True")
+                self._logger.debug(f"[OPENROUTER-PARAMS] Model: {request_params['model']}, format: json_schema strict=True, require_parameters=True")
             else:
                 # Simple JSON object for basic cases
                 request_params['response_format'] = {'type': 'json_object'}
@@ -199,18 +294,13 @@ class OpenRouterClient(LLMClient):
             # Make the API call
             response = await self.client.chat.completions.create(**request_params)
             
-            # Aggregated logging to reduce spam
-            provider = getattr(response, 'provider', 'Unknown')
-            model = getattr(response, 'model', 'Unknown')
-            
-            global _global_response_count
-            _global_response_count += 1
-            
-            # Log aggregated response (first call, then every 5th)
-            if _global_response_count == 1:
-                logger.debug(f"[{_global_response_count}] OpenRouter Response Served by: {provider}, with Model: {model}")
-            elif _global_response_count % 5 == 0:
-                logger.debug(f"[{_global_response_count}] OpenRouter Responses Served by: {provider}, with Model: {model}")
+            # Aggregated logging to reduce spam: first call, then every 5th
+            response_count = next(_response_counter)
+            if response_count == 1 or response_count % 5 == 0:
+                provider = getattr(response, 'provider', 'Unknown')
+                model = getattr(response, 'model', 'Unknown')
+                noun = 'Response' if response_count == 1 else 'Responses'
+                self._logger.debug(f"[{response_count}] OpenRouter {noun} Served by: {provider}, with Model: {model}")
             
             # Capture token usage for analytics
             if hasattr(response, 'usage') and response.usage:
@@ -229,9 +319,9 @@ class OpenRouterClient(LLMClient):
             result = response.choices[0].message.content or ''
 
             # Check if response is HTML (Cloudflare/infrastructure error)
-            if result.strip().startswith(('<!DOCTYPE html>', '<html')):
+            if _looks_like_html(result):
                 error_msg = _parse_html_error(result)
-                logger.error(error_msg)
+                self._logger.error(error_msg)
                 raise InfrastructureError(error_msg)
 
             # Strip markdown code fences if present. Claude (and some other
@@ -240,27 +330,27 @@ class OpenRouterClient(LLMClient):
             # (e.g. Anthropic via OpenAI-compat shims, some local gateways).
             stripped = result.strip()
             if stripped.startswith('```'):
-                stripped = re.sub(r'^```(?:json|JSON)?\s*\n?', '', stripped)
-                stripped = re.sub(r'\n?\s*```\s*$', '', stripped)
+                stripped = _RE_FENCE_OPEN.sub('', stripped)
+                stripped = _RE_FENCE_CLOSE.sub('', stripped)
                 result = stripped.strip()
 
-            return json.loads(result)
+            return _json_loads(result)
 
         except openai.RateLimitError as e:
             raise RateLimitError(str(e)) from e
         except json.JSONDecodeError as e:
             # Check if JSON decode error is due to HTML content
             content = getattr(e, 'doc', '') or str(e)
-            if '<!DOCTYPE html>' in content or '<html' in content:
+            if _looks_like_html(content):
                 error_msg = _parse_html_error(content)
-                logger.error(error_msg)
+                self._logger.error(error_msg)
                 raise InfrastructureError(error_msg)
-            logger.error(f'Error in generating LLM response: {e}')
+            self._logger.error(f'Error in generating LLM response: {e}')
             raise
         except InfrastructureError:
             raise  # Re-raise infrastructure errors without modification
         except Exception as e:
-            logger.error(f'Error in generating LLM response: {e}')
+            self._logger.error(f'Error in generating LLM response: {e}')
             raise
 
     async def generate_response(
@@ -272,13 +362,13 @@ class OpenRouterClient(LLMClient):
         group_id: str | None = None,
         prompt_name: str | None = None,
     ) -> dict[str, typing.Any]:
-        logger = logging.getLogger('graphiti_bridge.sync')
-        
         if max_tokens is None:
             max_tokens = self.max_tokens
 
         retry_count = 0
         last_error = None
+        # Only the latest retry note is kept, so retries don't keep growing the prompt
+        retry_message: Message | None = None
 
         # For OpenRouter, DON'T add schema to prompt when using structured output
         # The json_schema format handles this automatically
@@ -288,7 +378,7 @@ class OpenRouterClient(LLMClient):
             pass
 
         # Add multilingual extraction instructions
-        messages[0].content += get_extraction_language_instruction(group_id)
+        messages[0].content += _language_instruction(group_id)
 
         while retry_count <= self.MAX_RETRIES:
             try:
@@ -307,7 +397,7 @@ class OpenRouterClient(LLMClient):
                 last_error = e
 
                 if retry_count >= self.MAX_RETRIES:
-                    logger.error(
+                    self._logger.error(
                         f'Max retries ({self.MAX_RETRIES}) exceeded. Last error: {e}')
                     raise
 
@@ -321,9 +411,11 @@ class OpenRouterClient(LLMClient):
                     f'the expected format and constraints.'
                 )
 
-                error_message = Message(role='user', content=error_context)
-                messages.append(error_message)
-                logger.warning(
+                if retry_message is not None and messages and messages[-1] is retry_message:
+                    messages.pop()
+                retry_message = Message(role='user', content=error_context)
+                messages.append(retry_message)
+                self._logger.warning(
                     f'Retrying after application error (attempt {retry_count}/{self.MAX_RETRIES}): {e}'
                 )
 
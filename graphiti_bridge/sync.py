@@ -8,13 +8,6 @@ This script is called by the TypeScript plugin and handles the sync process for
 
 # Performance optimization flags
 import json
-from graphiti_core.llm_client.gemini_client import GeminiClient
-from graphiti_core.llm_client.anthropic_client import AnthropicClient
-from graphiti_core.driver.neo4j_driver import Neo4jDriver
-from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
-from graphiti_core.embedder.openai import OpenAIEmbedder, OpenAIEmbedderConfig
-from graphiti_core.llm_client.openai_generic_client import OpenAIGenericClient
-from graphiti_core.llm_client.openai_client import OpenAIClient
 from graphiti_core.llm_client.config import LLMConfig
 from graphiti_core.nodes import EpisodicNode
 from graphiti_core.utils.bulk_utils import RawEpisode
@@ -25,6 +18,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import re
 import argparse
+import functools
 import traceback
 import sys
 import asyncio
@@ -33,18 +27,47 @@ import time
 import os
 SKIP_VOYAGE_IMPORT = os.getenv('SKIP_VOYAGE_IMPORT', 'false').lower() == 'true'
 
+# Disable Graphiti telemetry once per process, unless the environment says otherwise.
+# Graphiti reads the flag when a client is created, so setting it after import is enough.
+os.environ.setdefault('GRAPHITI_TELEMETRY_ENABLED', 'false')
+
+# Optional fast JSON encoder for the stdout responses; falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Diagnostics buffer collected during run and attached to stdout JSON so callers that
 # only capture stdout (and not stderr) will still receive critical diagnostic messages.
-_DIAGNOSTICS_BUFFER = []
+# Sent as a JSON array, which is what the plugin reads.
+_DIAGNOSTICS_BUFFER: list = []
+
+# Resolved when a client is built, not at import, so setup_logging's bridge logger applies
+_LOGGER_NAME = 'graphiti_bridge.sync'
+
+# Third-party loggers silenced in non-debug runs (comprehensive list for ML libraries)
+_SILENCED_LOGGERS = (
+    'openai', 'httpx', 'neo4j', 'asyncio', 'urllib3', 'httpcore',
+    'sentence_transformers', 'transformers', 'torch',
+    'tokenizers', 'safetensors', 'accelerate', 'datasets',
+    'requests', 'matplotlib', 'PIL',
+    'anthropic', 'google', 'gemini', 'voyageai', 'azure',
+    'botocore', 'boto3', 's3transfer',
+    'numpy', 'scipy', 'sklearn', 'pandas',
+)
+_SILENCED_PREFIXES = tuple(name + '.' for name in _SILENCED_LOGGERS)
 
 # Import timing removed - not useful in production
 try:
-    # UTF-8 stdout encoding for Windows environments
+    # UTF-8 stdout encoding for Windows environments. Text is handed straight to the
+    # byte buffer (write_through) and never flushed per line, so explicit flush()
+    # calls are the only points where output reaches the TypeScript side.
     if hasattr(sys, 'stdout') and hasattr(sys.stdout, 'reconfigure'):
-        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stdout.reconfigure(encoding='utf-8', line_buffering=False, write_through=True)
     else:
         import io
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8',
+                                      line_buffering=False, write_through=True)
 except Exception:
     pass
 
@@ -61,49 +84,9 @@ except Exception:
 # Import timing removed - not useful in production
 
 
-# FalkorDB driver import with graceful fallback
-FALKORDB_AVAILABLE = False
-FalkorDriver = None
-try:
-    from graphiti_core.driver.falkordb_driver import FalkorDriver
-    FALKORDB_AVAILABLE = True
-except ImportError:
-    pass  # FalkorDB driver not available
-
-# Import LLM client creation function and configurations
-
-# Embedding provider imports (try graceful fallbacks)
-GEMINI_EMBEDDER_AVAILABLE = False
-GeminiEmbedder = None
-GeminiEmbedderConfig = None
-try:
-    from graphiti_core.embedder.gemini import GeminiEmbedder, GeminiEmbedderConfig
-    GEMINI_EMBEDDER_AVAILABLE = True
-except ImportError:
-    pass  # Gemini embedder not available
-
-VOYAGE_EMBEDDER_AVAILABLE = False
-VoyageAIEmbedder = None
-VoyageAIEmbedderConfig = None
-try:
-    from graphiti_core.embedder.voyage import VoyageAIEmbedder, VoyageAIEmbedderConfig
-    VOYAGE_EMBEDDER_AVAILABLE = True
-except ImportError:
-    pass  # Voyage embedder not available
-
-AZURE_EMBEDDER_AVAILABLE = False
-AzureOpenAIEmbedderClient = None
-try:
-    from graphiti_core.embedder.azure_openai import AzureOpenAIEmbedderClient
-    AZURE_EMBEDDER_AVAILABLE = True
-except ImportError:
-    pass  # Azure embedder not available
-
-# OpenAI embedder availability (always available since it's imported directly)
-OPENAI_EMBEDDER_AVAILABLE = True
-
-# No separate Ollama embedder - Graphiti uses OpenAIEmbedder with custom base_url for Ollama
-OLLAMA_EMBEDDER_AVAILABLE = True  # Always available since it uses OpenAIEmbedder
+# Provider SDKs (LLM clients, embedders, database drivers) are imported inside the
+# branch that selects them: a sync run uses one of each, and the others would only
+# add startup time. Optional embedders resolve through lazy_imports.
 
 
 # Import local modules - always use relative imports (production-safe)
@@ -116,18 +99,15 @@ from .utils import (
     extract_text_content,
     validate_note_file,
     print_json_response,
-    print_final_json_response,
     print_error_and_exit
 )
 from .models import initialize_global_loader, get_node_types, get_edge_types, get_entity_type_definitions, get_edge_type_definitions, get_edge_type_map, get_graphiti_entity_types, get_graphiti_edge_types, get_graphiti_edge_type_map
 from .openrouter_client import OpenRouterClient, InfrastructureError
+from .lazy_imports import get_gemini_embedder, get_voyage_embedder, get_azure_embedder
 
 
 async def main():
     """Main entry point for the sync script"""
-    import sys
-    import os
-
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Graphiti Bridge Sync Script')
     parser.add_argument('--vault-path', type=str,
@@ -158,28 +138,8 @@ async def main():
 
             # DO NOT use logging.disable() - it globally disables ALL logging
             # Instead, selectively disable specific third-party loggers
-            # Disable all known third-party loggers (comprehensive list for ML libraries)
-            # BUT preserve 'graphiti_bridge.sync' logger for our debug messages
-            for logger_name in [
-                'openai', 'httpx', 'neo4j', 'asyncio', 'urllib3', 'httpcore',
-                'sentence_transformers', 'transformers', 'torch',
-                'tokenizers', 'safetensors', 'accelerate', 'datasets',
-                'requests', 'urllib3.connectionpool', 'matplotlib', 'PIL',
-                'anthropic', 'google', 'gemini', 'voyageai',
-                'azure', 'azure.identity', 'azure.core',
-                'botocore', 'boto3', 's3transfer',
-                'numpy', 'scipy', 'sklearn', 'pandas'
-            ]:
-                # Skip disabling our sync logger even in non-debug mode
-                if logger_name != 'graphiti_bridge.sync':
-                    logger_obj = logging.getLogger(logger_name)
-                    logger_obj.disabled = True
-                    logger_obj.setLevel(logging.CRITICAL + 1)
-                    logger_obj.handlers.clear()
-
-            # Disable Graphiti telemetry properly
-            import os
-            os.environ['GRAPHITI_TELEMETRY_ENABLED'] = 'false'
+            # ('graphiti_bridge.sync' is preserved for our debug messages)
+            _silence_third_party_loggers()
 
         # Set up logging only if debug mode
         logger = setup_logging(debug_mode)
@@ -224,13 +184,17 @@ async def main():
             if plugin_data_path:
                 # If plugin_data_path points directly to data.json, derive vault root
                 pdp = Path(plugin_data_path)
-                if pdp.name == 'data.json' and 'plugins' in str(pdp):
+                # Indexing is clamped so short relative paths end at '.', as the old .parent chains did
+                pdp_parents = pdp.parents
+                last_parent = len(pdp_parents) - 1
+                in_plugins = 'plugins' in plugin_data_path
+                if pdp.name == 'data.json' and in_plugins:
                     # vault/.obsidian/plugins/<plugin-id>/data.json -> vault is 4 parents up
-                    init_vault_path = str(pdp.parent.parent.parent.parent)
-                elif 'plugins' in str(pdp):
+                    init_vault_path = str(pdp_parents[min(3, last_parent)])
+                elif in_plugins:
                     # If path contains 'plugins', assume it's a plugin directory: vault/.obsidian/plugins/<plugin-id>
                     # Need to go up 3 levels to reach vault root (directory not file)
-                    init_vault_path = str(pdp.parent.parent.parent)
+                    init_vault_path = str(pdp_parents[min(2, last_parent)])
                 else:
                     # Otherwise assume provided path is vault root or derive accordingly
                     init_vault_path = str(pdp)
@@ -297,17 +261,29 @@ async def main():
                 f'Fix the embedder provider/model in MegaMem Settings \u2192 Databases.'
             )
 
-        # Validate that we have exactly one note
-        if len(config.notes) != 1:
-            print_error_and_exit(
-                f"Expected exactly 1 note, got {len(config.notes)}")
+        if not config.notes:
+            print_error_and_exit("Expected at least 1 note, got 0")
 
-        # Process note with timing
+        # Process note(s) with timing
         note_processing_start = time.time()
-        if debug_mode:
-            logger.debug(f"Processing note: {config.notes[0]}")
-
-        result = await process_note(config.notes[0], graphiti, logger, config)
+        if len(config.notes) == 1:
+            if debug_mode:
+                logger.debug(f"Processing note: {config.notes[0]}")
+            result = await process_note(config.notes[0], graphiti, logger, config)
+        else:
+            # Batch run: one result per note, in input order
+            if debug_mode:
+                logger.debug(
+                    f"Processing {len(config.notes)} notes (max_concurrency={config.max_concurrency})")
+            results = await process_notes(config.notes, graphiti, logger, config)
+            failed = sum(1 for r in results if isinstance(r, dict) and r.get('status') == 'error')
+            if failed == 0:
+                status = 'success'
+            elif failed == len(results):
+                status = 'error'
+            else:
+                status = 'partial'
+            result = {'status': status, 'results': results}
 
         if debug_mode:
             note_processing_time = time.time() - note_processing_start
@@ -343,21 +319,17 @@ async def main():
             # Attach diagnostics buffer to result so callers that only capture stdout can see critical diagnostics
             try:
                 if isinstance(result, dict):
-                    result['_diagnostics'] = '\n'.join(
-                        str(item) for item in _DIAGNOSTICS_BUFFER)
+                    result['_diagnostics'] = _DIAGNOSTICS_BUFFER
                 else:
                     # If result is a non-dict (unexpected), wrap into dict preserving original
                     result = {
                         'status': 'success',
                         'result': result,
-                        '_diagnostics': '\n'.join(str(item) for item in _DIAGNOSTICS_BUFFER)
+                        '_diagnostics': _DIAGNOSTICS_BUFFER
                     }
             except Exception:
                 pass
 
-            # Force flush stdout before JSON response
-            sys.stdout.flush()
-
             # Add debug logging for final response (but don't log the full JSON to avoid contamination)
             if debug_mode:
                 logger.debug(
@@ -365,10 +337,7 @@ async def main():
 
             # Print the JSON response to stdout with explicit newline
             # CRITICAL: This MUST only go to stdout - TypeScript bridge communication
-            print_final_json_response(result)
-
-            # Force flush again to ensure it's sent
-            sys.stdout.flush()
+            _write_json(result)
 
         except Exception as print_error:
             # If JSON printing fails, send a basic error response
@@ -376,8 +345,7 @@ async def main():
                 'status': 'error',
                 'message': f'Failed to print JSON response: {print_error}'
             }
-            print(json.dumps(fallback_result, ensure_ascii=False,
-                  separators=(',', ':')), flush=True)
+            _write_json(fallback_result)
 
     except KeyboardInterrupt:
         # Restore stderr before error exit
@@ -398,15 +366,13 @@ async def main():
         }
         # Attach diagnostics buffer if available
         try:
-            error_response['_diagnostics'] = '\n'.join(
-                str(item) for item in _DIAGNOSTICS_BUFFER)
+            error_response['_diagnostics'] = _DIAGNOSTICS_BUFFER
         except Exception:
             pass
         # Ensure logger info if debug
         if logger and debug_mode:
             logger.debug("Printing keyboard interrupt JSON response")
-        print(json.dumps(error_response, ensure_ascii=False,
-                         separators=(',', ':')), flush=True)
+        _write_json(error_response)
         sys.exit(1)
     except Exception as e:
         # Restore stderr before error handling
@@ -436,8 +402,12 @@ async def main():
             # If stderr was redirected to a file-like object, try to read from it if it's seekable
             if hasattr(original_stderr, 'name') and original_stderr.name and original_stderr.name != '<stderr>':
                 try:
-                    with open(original_stderr.name, 'r', encoding='utf-8', errors='ignore') as f:
-                        stderr_contents = f.read()[-8000:]
+                    # Only the tail is read, however large the file has grown
+                    # (8000 characters are at most 4 bytes each in UTF-8)
+                    with open(original_stderr.name, 'rb') as f:
+                        size = f.seek(0, os.SEEK_END)
+                        f.seek(max(0, size - 4 * 8000))
+                        stderr_contents = f.read().decode('utf-8', errors='ignore')[-8000:]
                         error_response['stderr_tail'] = stderr_contents
                 except Exception:
                     # ignore read failures
@@ -446,16 +416,62 @@ async def main():
             pass
         # Attach diagnostics buffer if available
         try:
-            error_response['_diagnostics'] = '\n'.join(
-                str(item) for item in _DIAGNOSTICS_BUFFER)
+            error_response['_diagnostics'] = _DIAGNOSTICS_BUFFER
         except Exception:
             pass
         # Print JSON error response
-        print(json.dumps(error_response, ensure_ascii=False,
-                         separators=(',', ':')), flush=True)
+        _write_json(error_response)
         sys.exit(1)
 
 
+def _write_json(obj) -> None:
+    """Write obj to stdout as one compact JSON line (UTF-8), bypassing the text layer"""
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(obj) + b'\n'
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles those
+            pass
+    if payload is None:
+        payload = json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+    # Anything still pending in the text layer must reach the pipe first
+    sys.stdout.flush()
+    # Write straight to the fd so the plugin reads the line from a single write
+    # (atomic up to PIPE_BUF); larger payloads may need several os.write calls
+    remaining = memoryview(payload)
+    try:
+        fd = sys.stdout.fileno()
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+        return
+    except OSError:
+        # No usable fd (e.g. stdout replaced by a wrapper); finish through the buffer
+        pass
+
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        print(bytes(remaining).decode('utf-8'), end='', flush=True)
+        return
+    buffer.write(remaining)
+    buffer.flush()
+
+
+def _silence_third_party_loggers():
+    """Disable the _SILENCED_LOGGERS hierarchies for a non-debug run"""
+    for name in _SILENCED_LOGGERS:
+        logger_obj = logging.getLogger(name)
+        logger_obj.disabled = True
+        logger_obj.setLevel(logging.CRITICAL + 1)
+        logger_obj.handlers.clear()
+    # Existing child loggers may carry their own level or handlers
+    for name, logger_obj in list(logging.Logger.manager.loggerDict.items()):
+        if isinstance(logger_obj, logging.Logger) and name.startswith(_SILENCED_PREFIXES):
+            logger_obj.disabled = True
+            logger_obj.handlers.clear()
+
+
 def _get_ollama_base_url(url: Optional[str]) -> str:
     """
     Ensure Ollama base URL ends with /v1, appending if missing.
@@ -463,13 +479,131 @@ def _get_ollama_base_url(url: Optional[str]) -> str:
     """
     if not url:
         return 'http://localhost:11434/v1'
-    # Ensure URL ends with /v1
-    if not url.endswith('/v1') and not url.endswith('/v1/'):
-        return f'{url.rstrip("/")}/v1'
-    return url.rstrip('/')  # Remove trailing slash if it exists
+    # Drop trailing slashes, then ensure URL ends with /v1
+    url = url.rstrip('/')
+    return url if url.endswith('/v1') else f'{url}/v1'
 
 
-def create_embedder_client(config: BridgeConfig, debug: bool = False):
+def _sample_embedding_dim(vecs) -> Optional[int]:
+    """
+    Vector length of a sample embedding batch, or None if it is not a non-empty 2-D batch.
+    Goes through numpy (a graphiti-core dependency, imported only on this debug path) so
+    lists, tuples and ndarrays, including lists of ndarrays, are all read the same way.
+    """
+    try:
+        import numpy as np
+        shape = np.asarray(vecs, dtype=float).shape
+    except Exception:
+        # numpy unavailable, or ragged / non-numeric output
+        return None
+    return shape[1] if len(shape) == 2 and shape[0] else None
+
+
+def _make_openai_embedder(config: BridgeConfig, embedder_api_key):
+    """OpenAI Embedder"""
+    from graphiti_core.embedder.openai import OpenAIEmbedder, OpenAIEmbedderConfig
+    embedder_config = OpenAIEmbedderConfig(
+        api_key=embedder_api_key,
+        model=config.embedding_model
+    )
+    return OpenAIEmbedder(config=embedder_config)
+
+
+def _make_gemini_embedder(config: BridgeConfig, embedder_api_key):
+    """Google/Gemini Embedder"""
+    GeminiEmbedder, GeminiEmbedderConfig = get_gemini_embedder()
+    if GeminiEmbedder is None:
+        raise NotImplementedError(
+            f"Gemini embedder requested but not available. Install with: pip install graphiti-core[google-genai]")
+
+    embedder_config = GeminiEmbedderConfig(
+        api_key=embedder_api_key,
+        embedding_model=config.embedding_model
+    )
+    return GeminiEmbedder(config=embedder_config)
+
+
+def _make_voyage_embedder(config: BridgeConfig, embedder_api_key):
+    """Voyage AI Embedder"""
+    VoyageAIEmbedder, VoyageAIEmbedderConfig = get_voyage_embedder()
+    if VoyageAIEmbedder is None:
+        raise NotImplementedError(
+            f"Voyage embedder requested but not available. Install with: pip install voyageai")
+
+    # Use VoyageAIEmbedderConfig format (from test file)
+    embedder_config = VoyageAIEmbedderConfig(
+        api_key=embedder_api_key,
+        model=config.embedding_model
+    )
+    return VoyageAIEmbedder(config=embedder_config)
+
+
+def _make_azure_embedder(config: BridgeConfig, embedder_api_key):
+    """Azure OpenAI Embedder"""
+    AzureOpenAIEmbedderClient = get_azure_embedder()
+    if AzureOpenAIEmbedderClient is None:
+        raise NotImplementedError(
+            f"Azure OpenAI embedder requested but not available")
+
+    # Use Azure-specific configuration
+    return AzureOpenAIEmbedderClient(
+        api_key=embedder_api_key,
+        azure_endpoint=getattr(config, 'azure_endpoint', None),
+        api_version=getattr(config, 'azure_api_version',
+                            '2024-02-15-preview'),
+        model=config.embedding_model
+    )
+
+
+def _make_ollama_embedder(config: BridgeConfig, embedder_api_key):
+    """
+    Ollama Embedder (Local) - uses OpenAI embedder with custom base_url per Graphiti docs
+    @@vessel-protocol:Heimdall governs:validation context:Ollama embedder provider integration via OpenAI embedder
+    """
+    from graphiti_core.embedder.openai import OpenAIEmbedder, OpenAIEmbedderConfig
+
+    # Use OpenAI embedder with Ollama base URL (official Graphiti pattern)
+    ollama_base_url = _get_ollama_base_url(
+        getattr(config, 'ollama_base_url', None))
+    embedder_config = OpenAIEmbedderConfig(
+        api_key="ollama",  # Placeholder API key as per Graphiti docs
+        embedding_model=config.embedding_model,  # Corrected parameter name
+        embedding_dim=getattr(config, 'ollama_embedding_dim', 768),
+        base_url=ollama_base_url
+    )
+    return OpenAIEmbedder(config=embedder_config)
+
+
+def _make_openrouter_embedder(config: BridgeConfig, embedder_api_key):
+    """OpenRouter Embedder — OpenAI-compatible endpoint with custom base_url"""
+    from graphiti_core.embedder.openai import OpenAIEmbedder, OpenAIEmbedderConfig
+    embedder_config = OpenAIEmbedderConfig(
+        api_key=embedder_api_key,
+        embedding_model=config.embedding_model,
+        base_url="https://openrouter.ai/api/v1"
+    )
+    return OpenAIEmbedder(config=embedder_config)
+
+
+# Embedder provider -> factory(config, embedder_api_key); each factory imports its own SDK
+_EMBEDDER_FACTORIES = {
+    'openai': _make_openai_embedder,
+    'google': _make_gemini_embedder,
+    'voyage': _make_voyage_embedder,
+    'azure': _make_azure_embedder,
+    'ollama': _make_ollama_embedder,
+    'openrouter': _make_openrouter_embedder,
+}
+
+# Alternative provider names accepted in config
+_EMBEDDER_ALIASES = {
+    'google-ai': 'google',
+    'gemini': 'google',
+    'azure-openai': 'azure',
+}
+
+
+async def create_embedder_client(config: BridgeConfig, debug: bool = False):
     """
     Create embedder client based on config.embedder_provider.
     This allows mixing LLM and embedding providers (e.g., Google AI LLM + OpenAI embeddings).
@@ -481,91 +615,19 @@ def create_embedder_client(config: BridgeConfig, debug: bool = False):
         mismatches early and produces clearer logs instead of downstream Neo4j dimension errors.
     @@vessel-protocol:Heimdall governs:debug context:Embedder diagnostics for Ollama/embedding-dimension mismatches
     """
-    logger = logging.getLogger('graphiti_bridge.sync')
+    logger = logging.getLogger(_LOGGER_NAME)
 
     # Get embedder API key
     embedder_api_key = config.get_effective_embedder_api_key()
 
-    # Create embedder client based on provider
-    if config.embedder_provider == "openai":
-        # OpenAI Embedder
-        embedder_config = OpenAIEmbedderConfig(
-            api_key=embedder_api_key,
-            model=config.embedding_model
-        )
-        embedder = OpenAIEmbedder(config=embedder_config)
-
-    elif config.embedder_provider == "google" or config.embedder_provider == "google-ai" or config.embedder_provider == "gemini":
-        # Google/Gemini Embedder
-        if not GEMINI_EMBEDDER_AVAILABLE or GeminiEmbedder is None:
-            raise NotImplementedError(
-                f"Gemini embedder requested but not available. Install with: pip install graphiti-core[google-genai]")
-
-        embedder_config = GeminiEmbedderConfig(
-            api_key=embedder_api_key,
-            embedding_model=config.embedding_model
-        )
-        embedder = GeminiEmbedder(config=embedder_config)
-
-    elif config.embedder_provider == "voyage":
-        # Voyage AI Embedder
-        if not VOYAGE_EMBEDDER_AVAILABLE or VoyageAIEmbedder is None:
-            raise NotImplementedError(
-                f"Voyage embedder requested but not available. Install with: pip install voyageai")
-
-        # Use VoyageAIEmbedderConfig format (from test file)
-        embedder_config = VoyageAIEmbedderConfig(
-            api_key=embedder_api_key,
-            model=config.embedding_model
-        )
-        embedder = VoyageAIEmbedder(config=embedder_config)
-
-    elif config.embedder_provider == "azure" or config.embedder_provider == "azure-openai":
-        # Azure OpenAI Embedder
-        if not AZURE_EMBEDDER_AVAILABLE or AzureOpenAIEmbedderClient is None:
-            raise NotImplementedError(
-                f"Azure OpenAI embedder requested but not available")
-
-        # Use Azure-specific configuration
-        embedder = AzureOpenAIEmbedderClient(
-            api_key=embedder_api_key,
-            azure_endpoint=getattr(config, 'azure_endpoint', None),
-            api_version=getattr(config, 'azure_api_version',
-                                '2024-02-15-preview'),
-            model=config.embedding_model
-        )
-
-    elif config.embedder_provider == "ollama":
-        # @@vessel-protocol:Heimdall governs:validation context:Ollama embedder provider integration via OpenAI embedder
-        # Ollama Embedder (Local) - uses OpenAI embedder with custom base_url per Graphiti docs
-        if not OPENAI_EMBEDDER_AVAILABLE or OpenAIEmbedder is None:
-            raise NotImplementedError(
-                f"Ollama embedder requested but OpenAI embedder not available. Install with: pip install graphiti-core")
-
-        # Use OpenAI embedder with Ollama base URL (official Graphiti pattern)
-        ollama_base_url = _get_ollama_base_url(
-            getattr(config, 'ollama_base_url', None))
-        embedder_config = OpenAIEmbedderConfig(
-            api_key="ollama",  # Placeholder API key as per Graphiti docs
-            embedding_model=config.embedding_model,  # Corrected parameter name
-            embedding_dim=getattr(config, 'ollama_embedding_dim', 768),
-            base_url=ollama_base_url
-        )
-        embedder = OpenAIEmbedder(config=embedder_config)
-
-    elif config.embedder_provider == "openrouter":
-        # OpenRouter Embedder — OpenAI-compatible endpoint with custom base_url
-        embedder_config = OpenAIEmbedderConfig(
-            api_key=embedder_api_key,
-            embedding_model=config.embedding_model,
-            base_url="https://openrouter.ai/api/v1"
-        )
-        embedder = OpenAIEmbedder(config=embedder_config)
-
-    else:
+    # Create embedder client based on provider (aliases map onto one factory)
+    provider = _EMBEDDER_ALIASES.get(config.embedder_provider, config.embedder_provider)
+    factory = _EMBEDDER_FACTORIES.get(provider)
+    if factory is None:
         # Unsupported embedder provider
         raise NotImplementedError(
             f"Embedder provider '{config.embedder_provider}' is not supported. Supported: openai, google, voyage, azure, ollama, openrouter")
+    embedder = factory(config, embedder_api_key)
 
     # ---- Diagnostics (debug-only) ----
     if debug:
@@ -577,48 +639,51 @@ def create_embedder_client(config: BridgeConfig, debug: bool = False):
             logger.debug(
                 "[EMBEDDER-DEBUG] Could not read embedder_config for diagnostic logging")
 
-        # If the embedder exposes an async embed method, attempt a single sample to get returned vector length.
-        # Wrap in try/except to avoid breaking initialization if network/permissions fail.
-        try:
-            # Many Graphiti embedders implement either `embed` or `embed_documents` async methods.
-            sample_call = None
-            if hasattr(embedder, 'embed') and asyncio.iscoroutinefunction(embedder.embed):
-                sample_call = embedder.embed(["diagnostic test"])
-            elif hasattr(embedder, 'embed_documents') and asyncio.iscoroutinefunction(embedder.embed_documents):
-                sample_call = embedder.embed_documents(["diagnostic test"])
-            elif hasattr(embedder, 'embed') and not asyncio.iscoroutinefunction(embedder.embed):
-                # sync embed
-                vecs = embedder.embed(["diagnostic test"])
-                if isinstance(vecs, list) and len(vecs) > 0 and isinstance(vecs[0], (list, tuple)):
-                    logger.debug(
-                        f"[EMBEDDER-DEBUG] Sample embedding length (sync): {len(vecs[0])}")
-            if sample_call is not None:
-                # Run the coroutine to completion (safe in initialization context)
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = None
-                if loop and loop.is_running():
-                    # We're in an event loop — schedule task and await it
-                    # Create task and wait synchronously with asyncio.run_coroutine_threadsafe if running in different thread
-                    import concurrent.futures
-                    import threading
-                    fut = asyncio.run_coroutine_threadsafe(sample_call, loop)
-                    vecs = fut.result(timeout=10)
-                else:
-                    # Safe to run with asyncio.run
-                    vecs = asyncio.run(sample_call)
-                if isinstance(vecs, list) and len(vecs) > 0 and isinstance(vecs[0], (list, tuple)):
-                    logger.debug(
-                        f"[EMBEDDER-DEBUG] Sample embedding length (async): {len(vecs[0])}")
-                else:
-                    logger.debug(
-                        f"[EMBEDDER-DEBUG] Sample embedding returned type: {type(vecs)}")
-        except Exception as e:
+        # The sample is a real (billable, possibly rate-limited) request, so by default
+        # only the local ollama provider is probed unless probeEmbedder says otherwise
+        probe = getattr(config, 'probe_embedder', None)
+        if probe is None:
+            probe = provider == 'ollama'
+        if not probe:
             logger.debug(
-                f"[EMBEDDER-DEBUG] Sample embedding diagnostic failed: {e}")
+                "[EMBEDDER-DEBUG] Skipping sample embedding probe for remote provider")
+        else:
+            # If the embedder exposes an async embed method, attempt a single sample to get returned vector length.
+            # Wrap in try/except to avoid breaking initialization if network/permissions fail.
+            try:
+                # Many Graphiti embedders implement either `embed` or `embed_documents` async methods.
+                sample_call = None
+                if hasattr(embedder, 'embed') and asyncio.iscoroutinefunction(embedder.embed):
+                    sample_call = embedder.embed(["diagnostic test"])
+                elif hasattr(embedder, 'embed_documents') and asyncio.iscoroutinefunction(embedder.embed_documents):
+                    sample_call = embedder.embed_documents(["diagnostic test"])
+                elif hasattr(embedder, 'embed') and not asyncio.iscoroutinefunction(embedder.embed):
+                    # sync embed
+                    vecs = embedder.embed(["diagnostic test"])
+                    dim = _sample_embedding_dim(vecs)
+                    if dim is not None:
+                        logger.debug(
+                            f"[EMBEDDER-DEBUG] Sample embedding length (sync): {dim}")
+                if sample_call is not None:
+                    # Callers are async, so the sample is simply awaited on their loop
+                    vecs = await asyncio.wait_for(sample_call, timeout=10)
+                    dim = _sample_embedding_dim(vecs)
+                    if dim is not None:
+                        logger.debug(
+                            f"[EMBEDDER-DEBUG] Sample embedding length (async): {dim}")
+                    else:
+                        logger.debug(
+                            f"[EMBEDDER-DEBUG] Sample embedding returned type: {type(vecs)}")
+            except Exception as e:
+                logger.debug(
+                    f"[EMBEDDER-DEBUG] Sample embedding diagnostic failed: {e}")
     # ---- End diagnostics ----
 
+    if config.batch_embeddings:
+        # Coalesce Graphiti's per-text embedding calls into batch requests
+        from .batching_embedder import BatchingEmbedder
+        embedder = BatchingEmbedder(embedder)
+
     return embedder
 
 
@@ -654,7 +719,7 @@ async def check_dimension_compatibility(graphiti, config: 'BridgeConfig', logger
         # Step 2: Get dims from configured embedder via a test embedding
         expected_dims = None
         try:
-            embedder_client = create_embedder_client(config, False)
+            embedder_client = await create_embedder_client(config, False)
             if embedder_client and hasattr(embedder_client, 'create'):
                 test_vector = await embedder_client.create("dimension check")
                 if isinstance(test_vector, list) and len(test_vector) > 0:
@@ -678,15 +743,16 @@ async def check_dimension_compatibility(graphiti, config: 'BridgeConfig', logger
     return embedder
 
 
+@functools.lru_cache(maxsize=1)
 def _make_noop_cross_encoder():
     """
     Minimal stub satisfying Graphiti's cross_encoder constructor requirement.
     Graphiti hardcodes RRF for ranking internally; this arg is unused for add_episode
     and search. Passing None causes Graphiti to instantiate OpenAIRerankerClient() as
     its default, which crashes without OPENAI_API_KEY. This stub satisfies the
-    interface silently with zero API calls.
+    interface silently with zero API calls. It holds no state, so one instance is shared.
     """
-    from graphiti_core.llm_client.config import LLMConfig
+    from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
 
     noop = OpenAIRerankerClient(config=LLMConfig(api_key="noop", model="noop"))
 
@@ -704,7 +770,7 @@ async def initialize_graphiti(config: BridgeConfig, debug: bool = False):
     
     NOTE: This function is async in Graphiti 0.22+ to support async driver initialization.
     """
-    logger = logging.getLogger('graphiti_bridge.sync')
+    logger = logging.getLogger(_LOGGER_NAME)
 
     try:
         # Retrieve API keys robustly
@@ -728,7 +794,7 @@ async def initialize_graphiti(config: BridgeConfig, debug: bool = False):
         # =====================================================================
 
         # Create embedder client (separate from LLM provider for mix-and-match support)
-        embedder_client = create_embedder_client(config, debug)
+        embedder_client = await create_embedder_client(config, debug)
 
         if config.llm_provider == "openai":
             # ===== OPENAI PROVIDER =====
@@ -777,6 +843,7 @@ async def initialize_graphiti(config: BridgeConfig, debug: bool = False):
                     logger.debug(
                         f"Using standard GPT model {config.llm_model} - excluding reasoning/verbosity parameters")
 
+            from graphiti_core.llm_client.openai_client import OpenAIClient
             llm_client = OpenAIClient(**client_params)
 
             cross_encoder = _make_noop_cross_encoder()
@@ -794,6 +861,7 @@ async def initialize_graphiti(config: BridgeConfig, debug: bool = False):
                 small_model=getattr(config, 'llm_small_model', None),
                 base_url=getattr(config, 'llm_base_url', None)
             )
+            from graphiti_core.llm_client.gemini_client import GeminiClient
             llm_client = GeminiClient(config=llm_config)
             if debug:
                 logger.info(
@@ -814,6 +882,7 @@ async def initialize_graphiti(config: BridgeConfig, debug: bool = False):
                 small_model=getattr(config, 'llm_small_model', None),
                 base_url=getattr(config, 'llm_base_url', None)
             )
+            from graphiti_core.llm_client.anthropic_client import AnthropicClient
             llm_client = AnthropicClient(config=llm_config)
             if debug:
                 logger.info(
@@ -842,6 +911,7 @@ async def initialize_graphiti(config: BridgeConfig, debug: bool = False):
                 small_model=ollama_small,
                 base_url=ollama_base_url
             )
+            from graphiti_core.llm_client.openai_generic_client import OpenAIGenericClient
             llm_client = OpenAIGenericClient(config=llm_config)
             if debug:
                 logger.info(
@@ -862,6 +932,7 @@ async def initialize_graphiti(config: BridgeConfig, debug: bool = False):
                 small_model=getattr(config, 'llm_small_model', None),
                 base_url=venice_base
             )
+            from graphiti_core.llm_client.openai_generic_client import OpenAIGenericClient
             llm_client = OpenAIGenericClient(config=llm_config)
             if debug:
                 logger.info(
@@ -931,12 +1002,13 @@ async def initialize_graphiti(config: BridgeConfig, debug: bool = False):
 
         if db_type == 'falkordb':
             # ===== FALKORDB DRIVER =====
-            if not FALKORDB_AVAILABLE or FalkorDriver is None:
+            try:
+                from graphiti_core.driver.falkordb_driver import FalkorDriver
+            except ImportError:
                 raise NotImplementedError(
                     f"FalkorDB driver requested but not available. Install with: pip install graphiti-core[falkordb]")
 
             # Parse redis URL format (redis://host:port)
-            import re
             match = re.match(r'redis://([^:]+):(\d+)', config.database_url)
             if match:
                 host, port = match.groups()
@@ -958,6 +1030,7 @@ async def initialize_graphiti(config: BridgeConfig, debug: bool = False):
             )
         else:
             # ===== NEO4J DRIVER (DEFAULT) =====
+            from graphiti_core.driver.neo4j_driver import Neo4jDriver
 
             driver = Neo4jDriver(
                 uri=config.database_url,
@@ -989,7 +1062,6 @@ async def initialize_graphiti(config: BridgeConfig, debug: bool = False):
             logger.exception("Full exception details:")
             logger.error(
                 "Ensure graphiti-core is installed and configured correctly.")
-        import traceback
         return None
 
 
@@ -1066,6 +1138,35 @@ def extract_episode_uuid_from_result(graphiti_result, debug_mode: bool, logger)
     return episode_uuid
 
 
+async def process_notes(note_paths, graphiti, logger, config: BridgeConfig) -> list:
+    """
+    Process several notes concurrently on one Graphiti client, at most
+    config.max_concurrency at a time, so embedding/LLM/database round-trips overlap.
+    Returns one result per note in input order; an exception escaping process_note
+    becomes an error result for that note. Concurrency is opt-in (default 1): notes
+    feeding the same namespace can produce overlapping entities when extracted
+    concurrently.
+    """
+    semaphore = asyncio.Semaphore(max(1, config.max_concurrency or 1))
+
+    async def run(note_path):
+        async with semaphore:
+            return await process_note(note_path, graphiti, logger, config)
+
+    results = await asyncio.gather(*(run(path) for path in note_paths), return_exceptions=True)
+    processed = []
+    for note_path, result in zip(note_paths, results):
+        if isinstance(result, BaseException):
+            result = {
+                'note_path': note_path,
+                'note_name': Path(note_path).stem,
+                'status': 'error',
+                'error': str(result)
+            }
+        processed.append(result)
+    return processed
+
+
 async def process_note(note_path: str, graphiti, logger, config: BridgeConfig) -> Optional[Dict[str, Any]]:
     """
     Process a single note file using correct Graphiti API
@@ -1769,8 +1870,6 @@ async def create_custom_entity_episode(graphiti, note_name: str, clean_text: str
         return result
 
     except Exception as e:
-        import traceback
-
         if hasattr(logger, 'warning'):
             logger.warning(
                 f"Custom entity episode creation failed: {e}, falling back to generic episode")
@@ -137,9 +137,56 @@ warnings.filterwarnings(
 )
 
 
+# BridgeConfig fields that initialize_graphiti (and the embedder/LLM factories it calls)
+# builds the client from. While they are unchanged between sync commands, the daemon
+# keeps its Graphiti client (and driver pool).
+_CLIENT_CONFIG_FIELDS = (
+    'llm_provider', 'llm_model', 'llm_small_model', 'llm_api_key', 'api_keys',
+    'embedder_provider', 'embedding_model', 'embedder_api_key',
+    'azure_endpoint', 'azure_api_version', 'ollama_base_url',
+    'openrouter_preset_slug', 'openrouter_use_preset_with_custom_model',
+    'database_type', 'database_url', 'database_name', 'database_username', 'database_password',
+    'batch_embeddings', 'probe_embedder', 'debug',
+)
+
+
+def _client_config_key(cfg: BridgeConfig) -> str:
+    """Stable key for the client-relevant part of a config"""
+    return json.dumps([getattr(cfg, name, None) for name in _CLIENT_CONFIG_FIELDS],
+                      sort_keys=True, default=str)
+
+
 class SyncDaemon:
     def __init__(self):
         self.running = True
+        # One event loop for the daemon's lifetime: the Graphiti client's driver pool is
+        # bound to the loop it was opened on, so reusing the client needs a reused loop
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._graphiti = None
+        self._graphiti_key: Optional[str] = None
+
+    async def _close_graphiti(self):
+        """Close the cached Graphiti client, if any"""
+        graphiti, self._graphiti, self._graphiti_key = self._graphiti, None, None
+        if graphiti is None:
+            return
+        try:
+            if hasattr(graphiti, 'close'):
+                await graphiti.close()
+        except Exception:
+            pass
+
+    async def _get_graphiti(self, cfg: BridgeConfig):
+        """Cached Graphiti client for cfg, rebuilt when the client-relevant config changes"""
+        key = _client_config_key(cfg)
+        if self._graphiti is not None and key == self._graphiti_key:
+            return self._graphiti
+        await self._close_graphiti()
+        graphiti = await sync.initialize_graphiti(cfg, cfg.debug)
+        if graphiti:
+            self._graphiti, self._graphiti_key = graphiti, key
+        return graphiti
 
     def _build_result_error(self, message: str) -> Dict[str, Any]:
         return {
@@ -151,9 +198,8 @@ class SyncDaemon:
         """
         Reuse sync.py internal pipeline without touching stdout:
         - initialize_global_loader (for custom ontology)
-        - initialize_graphiti
+        - initialize_graphiti (cached across commands, see _get_graphiti)
         - process_note
-        - close drivers
         """
         try:
             # Initialize custom ontology if enabled (matches sync.py main() logic)
@@ -173,7 +219,7 @@ class SyncDaemon:
             else:
                 logger.debug("[DAEMON] Skipping custom ontology initialization (disabled or no vault path)")
             
-            graphiti = await sync.initialize_graphiti(cfg, cfg.debug)
+            graphiti = await self._get_graphiti(cfg)
             if not graphiti:
                 return self._build_result_error("Failed to initialize Graphiti")
 
@@ -186,13 +232,10 @@ class SyncDaemon:
 
             try:
                 result = await sync.process_note(cfg.notes[0], graphiti, py_logger, cfg)
-            finally:
-                # Ensure connections are closed
-                try:
-                    if hasattr(graphiti, 'close'):
-                        await graphiti.close()
-                except Exception:
-                    pass
+            except Exception:
+                # The connection may be what failed; start from a fresh client next time
+                await self._close_graphiti()
+                raise
 
             if result is None:
                 return self._build_result_error("No result generated")
@@ -241,10 +284,10 @@ class SyncDaemon:
 
         try:
             # Non-ASCII entity names (e.g. Japanese) can still cause a silent sync failure
-            # due to Neo4j BM25 Lucene query errors in search_utils.py. asyncio.run()
-            # eliminates the RuntimeWarning symptom; the underlying Lucene sanitizer
-            # issue is a separate open investigation.
-            return asyncio.run(self._run_single_note(cfg))
+            # due to Neo4j BM25 Lucene query errors in search_utils.py. Running on an
+            # explicitly owned loop (as asyncio.run() did) avoids the RuntimeWarning
+            # symptom; the underlying Lucene sanitizer issue is a separate open investigation.
+            return self.loop.run_until_complete(self._run_single_note(cfg))
         except Exception as e:
             logger.error(f"[DAEMON] Event loop execution error: {e}")
             return self._build_result_error(f"Async execution failed: {e}")
@@ -308,6 +351,17 @@ class SyncDaemon:
             print(json.dumps(response), flush=True)
 
         self.running = False
+        self.close()
+
+    def close(self):
+        """Close the cached Graphiti client and the daemon's event loop"""
+        if self.loop.is_closed():
+            return
+        try:
+            self.loop.run_until_complete(self._close_graphiti())
+        except Exception:
+            pass
+        self.loop.close()
 
 
 def signal_handler(signum, frame):
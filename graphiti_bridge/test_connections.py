@@ -128,9 +128,9 @@ def validate_config(config: BridgeConfig, test_type: str) -> list:
     return errors
 
 
-def create_embedder_client(config: BridgeConfig, start_time: float):
+async def create_embedder_client(config: BridgeConfig, start_time: float):
     """Delegate to sync.create_embedder_client to ensure parity with sync.py"""
-    return sync_create_embedder_client(config, debug=False)
+    return await sync_create_embedder_client(config, debug=False)
 
 
 def test_database_connection(config: BridgeConfig) -> Tuple[bool, str, int]:
@@ -330,7 +330,7 @@ async def test_embedding_connection(config: BridgeConfig) -> Tuple[bool, str, in
 
     try:
         setup_environment_variables(config)
-        embedder_client = create_embedder_client(config, start_time)
+        embedder_client = await create_embedder_client(config, start_time)
 
         if embedder_client:
             message = f"Embedding connection successful (provider: {config.embedder_provider}, model: {config.embedding_model}) - client instantiated"
@@ -350,7 +350,7 @@ async def test_embedding_with_dimensions(config: BridgeConfig) -> Tuple[bool, st
 
     try:
         setup_environment_variables(config)
-        embedder_client = create_embedder_client(config, start_time)
+        embedder_client = await create_embedder_client(config, start_time)
 
         if not embedder_client:
             return False, f"Embedder client instantiation failed for {config.embedder_provider}", get_latency_ms(start_time)
@@ -396,7 +396,7 @@ async def check_dimension_compatibility_test(config: BridgeConfig) -> Tuple[bool
         setup_environment_variables(config)
 
         # Step 1: Get expected dims from configured embedder
-        embedder_client = sync_create_embedder_client(config, False)
+        embedder_client = await sync_create_embedder_client(config, False)
         if not embedder_client:
             return False, f"Could not create embedder client for {config.embedder_provider}", get_latency_ms(start_time)
 
@@ -537,7 +537,7 @@ async def test_provider_combination(config: BridgeConfig) -> Tuple[bool, str, in
                 llm_client = OpenAIGenericClient(config=llm_config)
         else:
             return False, f"Unsupported LLM provider: {config.llm_provider}", get_latency_ms(start_time)
-        embedder_client = create_embedder_client(config, start_time)
+        embedder_client = await create_embedder_client(config, start_time)
 
         if llm_client and embedder_client:
             message = f"Provider combination successful (LLM: {config.llm_provider}/{config.llm_model}, Embedding: {config.embedder_provider}/{config.embedding_model}) - both clients instantiated"
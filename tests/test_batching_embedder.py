@@ -0,0 +1,67 @@
+import asyncio
+import unittest
+
+try:
+    from graphiti_core.embedder.client import EmbedderClient
+except ImportError:  # graphiti-core is installed by the plugin, not always in dev envs
+    EmbedderClient = None
+
+if EmbedderClient is not None:
+    from graphiti_bridge.batching_embedder import BatchingEmbedder
+
+    class RecordingEmbedder(EmbedderClient):
+        """Embeds a text as [len(text)] and records every request it receives"""
+
+        def __init__(self):
+            self.create_calls = []
+            self.batch_calls = []
+
+        async def create(self, input_data):
+            self.create_calls.append(input_data)
+            return [float(len(input_data[0]))]
+
+        async def create_batch(self, input_data_list):
+            self.batch_calls.append(list(input_data_list))
+            return [[float(len(text))] for text in input_data_list]
+
+
+@unittest.skipIf(EmbedderClient is None, "graphiti-core is not installed")
+class BatchingEmbedderTest(unittest.TestCase):
+
+    def test_single_element_lists_are_coalesced(self):
+        inner = RecordingEmbedder()
+        embedder = BatchingEmbedder(inner)
+
+        async def run():
+            # The way Graphiti embeds node names and edge facts
+            return await asyncio.gather(
+                embedder.create(input_data=['a']),
+                embedder.create(input_data=['bbb']),
+                embedder.create(input_data=['a']),
+            )
+
+        self.assertEqual(asyncio.run(run()), [[1.0], [3.0], [1.0]])
+        self.assertEqual(inner.batch_calls, [['a', 'bbb']])
+        self.assertEqual(inner.create_calls, [])
+
+    def test_multi_element_lists_pass_through(self):
+        inner = RecordingEmbedder()
+        embedder = BatchingEmbedder(inner)
+
+        self.assertEqual(asyncio.run(embedder.create(['ab', 'c'])), [2.0])
+        self.assertEqual(inner.create_calls, [['ab', 'c']])
+        self.assertEqual(inner.batch_calls, [])
+
+    def test_max_batch_flushes_early(self):
+        inner = RecordingEmbedder()
+        embedder = BatchingEmbedder(inner, max_batch=2, max_wait_ms=50)
+
+        async def run():
+            return await asyncio.gather(*(embedder.create([text]) for text in ('a', 'bb', 'ccc')))
+
+        self.assertEqual(asyncio.run(run()), [[1.0], [2.0], [3.0]])
+        self.assertEqual(inner.batch_calls, [['a', 'bb'], ['ccc']])
+
+
+if __name__ == '__main__':
+    unittest.main()